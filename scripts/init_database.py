@@ -162,6 +162,12 @@ def create_indexes(conn: sqlite3.Connection) -> None:
         ),
         ("idx_pnl_year_month", "pnl_sms_by_month", "(year, month)"),
         ("idx_pnl_building", "pnl_sms_by_month", "(building_name)"),
+        # Case-insensitive building lookups (load_from_sqlite location filter)
+        (
+            "idx_pnl_building_nocase_year_month",
+            "pnl_sms_by_month",
+            "(building_name COLLATE NOCASE, year, month)",
+        ),
         # Indexes for private_office_occupancies_by_building
         ("idx_occupancy_date", "private_office_occupancies_by_building", "(date)"),
         (
@@ -174,6 +180,11 @@ def create_indexes(conn: sqlite3.Connection) -> None:
             "private_office_occupancies_by_building",
             "(building_name, date)",
         ),
+        (
+            "idx_occupancy_building_nocase_date",
+            "private_office_occupancies_by_building",
+            "(building_name COLLATE NOCASE, date)",
+        ),
         # Indexes for published_prices
         (
             "idx_prices_building_year_from",
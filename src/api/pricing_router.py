@@ -7,7 +7,7 @@ router = APIRouter(prefix="/api/v1")
 
 
 @router.get("/pricing/{location}", response_model=Optional[PricingCLIOutput])
-async def get_pricing_for_location(
+def get_pricing_for_location(
     location: str,
     year: Optional[int] = Query(
         None, description="Year for pricing (default: current year)"
@@ -18,7 +18,7 @@ async def get_pricing_for_location(
 ):
     try:
         pricing_service = get_pricing_service()
-        result = await pricing_service.get_pricing_for_location(location, year, month)
+        result = pricing_service.get_pricing_for_location(location, year, month)
         if result is None:
             raise HTTPException(
                 status_code=404, detail=f"No data for location '{location}'."
@@ -29,7 +29,7 @@ async def get_pricing_for_location(
 
 
 @router.get("/pricing", response_model=List[PricingCLIOutput])
-async def get_pricing_for_all_locations(
+def get_pricing_for_all_locations(
     year: Optional[int] = Query(
         None, description="Year for pricing (default: current year)"
     ),
@@ -39,7 +39,7 @@ async def get_pricing_for_all_locations(
 ):
     try:
         pricing_service = get_pricing_service()
-        results = await pricing_service.get_pricing_for_all_locations(year, month)
+        results = pricing_service.get_pricing_for_all_locations(year, month)
         if not results:
             raise HTTPException(
                 status_code=404,
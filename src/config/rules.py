@@ -4,8 +4,10 @@ Configuration rules management for the pricing engine.
 This module handles loading and managing pricing rules from configuration files.
 """
 
+import copy
 import yaml
 import os
+from functools import lru_cache
 from typing import Any, Dict
 
 
@@ -13,10 +15,26 @@ from typing import Any, Dict
 CONFIG_PATH = os.path.join(os.path.dirname(__file__), "../../config/pricing_rules.yaml")
 
 
+@lru_cache(maxsize=8)
+def _parse_pricing_rules(config_path: str) -> Dict[str, Any]:
+    """Parse the YAML config file (cached per path, never handed out directly)."""
+    try:
+        with open(config_path, "r") as f:
+            return yaml.safe_load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {config_path}")
+    except yaml.YAMLError as e:
+        raise yaml.YAMLError(f"Error parsing YAML configuration file: {e}")
+
+
 def load_pricing_rules(config_path: str = CONFIG_PATH) -> Dict[str, Any]:
     """
     Load pricing rules from the YAML config file.
 
+    The file is parsed once per path; each call returns a fresh copy, so
+    callers may modify the result without affecting the cache. Call
+    clear_cache() to pick up edits to the file.
+
     Args:
         config_path: Path to the YAML configuration file.
                     Defaults to the standard config location.
@@ -28,10 +46,9 @@ def load_pricing_rules(config_path: str = CONFIG_PATH) -> Dict[str, Any]:
         FileNotFoundError: If the configuration file doesn't exist.
         yaml.YAMLError: If the YAML file is malformed.
     """
-    try:
-        with open(config_path, "r") as f:
-            return yaml.safe_load(f)
-    except FileNotFoundError:
-        raise FileNotFoundError(f"Configuration file not found: {config_path}")
-    except yaml.YAMLError as e:
-        raise yaml.YAMLError(f"Error parsing YAML configuration file: {e}")
+    return copy.deepcopy(_parse_pricing_rules(config_path))
+
+
+def clear_cache() -> None:
+    """Forget all parsed config files."""
+    _parse_pricing_rules.cache_clear()
@@ -10,10 +10,10 @@ from datetime import date, datetime, timedelta
 import pandas as pd
 
 try:
-    from src.data.storage import load_from_sqlite
+    from src.data.storage import load_from_sqlite, load_from_sqlite_filtered
 except ImportError:
     # Fallback for when running the script directly
-    from data.storage import load_from_sqlite
+    from data.storage import load_from_sqlite, load_from_sqlite_filtered
 
 
 class DataLoaderService:
@@ -94,33 +94,15 @@ class DataLoaderService:
         Returns:
             DataFrame with monthly expense data
         """
-        # Calculate 3 months prior for expense averaging
-        target_datetime = datetime(target_year, target_month, 1)
-        three_months_ago = target_datetime - timedelta(days=90)
-        start_year = three_months_ago.year
-        start_month = three_months_ago.month
-
         try:
-            # Load monthly expense data for the last 3 months
-            monthly_df = load_from_sqlite("pnl_sms_by_month")
-
-            # Filter to last 3 months
-            monthly_df = monthly_df[
-                (
-                    (monthly_df["year"] == target_year)
-                    & (monthly_df["month"] >= start_month)
-                )
-                | (
-                    (monthly_df["year"] == start_year)
-                    & (monthly_df["month"] >= start_month)
-                )
-            ]
-
-            # Filter by location if specified
-            if location:
-                monthly_df = monthly_df[
-                    monthly_df["building_name"].str.lower() == location.lower()
-                ]
+            # Only the target month and the 3 months before it are read, and
+            # the location (if any) is matched case-insensitively in SQL
+            monthly_df = load_from_sqlite_filtered(
+                "pnl_sms_by_month",
+                target_year,
+                target_month,
+                location=location or None,
+            )
 
             print(
                 f"Loaded {len(monthly_df)} rows from monthly expense data (last 3 months)."
@@ -147,8 +129,11 @@ class DataLoaderService:
         target_datetime = datetime.strptime(target_date, "%Y-%m-%d")
 
         try:
-            # Load daily occupancy data for last 7 days from target date
-            daily_df = load_from_sqlite("private_office_occupancies_by_building")
+            # Load daily occupancy data; the location (if any) is matched
+            # case-insensitively in SQL
+            daily_df = load_from_sqlite(
+                "private_office_occupancies_by_building", location=location or None
+            )
 
             # Calculate date range for past 7 days (excluding target date)
             seven_days_ago = target_datetime - timedelta(days=7)
@@ -166,12 +151,6 @@ class DataLoaderService:
             if not daily_df.empty and "date" in daily_df.columns:
                 daily_df = daily_df[daily_df["date"].isin(date_range)]
 
-                # Filter by location if specified
-                if location:
-                    daily_df = daily_df[
-                        daily_df["building_name"].str.lower() == location.lower()
-                    ]
-
                 print(
                     f"Loaded {len(daily_df)} rows from daily occupancy data for past 7 days "
                     f"({seven_days_ago.strftime('%Y-%m-%d')} to {(target_datetime - timedelta(days=1)).strftime('%Y-%m-%d')})."
@@ -210,14 +189,10 @@ class DataLoaderService:
                             )
                             # Reload the filtered data after fetching
                             daily_df = load_from_sqlite(
-                                "private_office_occupancies_by_building"
+                                "private_office_occupancies_by_building",
+                                location=location or None,
                             )
                             daily_df = daily_df[daily_df["date"].isin(date_range)]
-                            if location:
-                                daily_df = daily_df[
-                                    daily_df["building_name"].str.lower()
-                                    == location.lower()
-                                ]
                             print(
                                 f"Reloaded {len(daily_df)} rows from daily occupancy data."
                             )
@@ -1,6 +1,7 @@
+import os
 import sqlite3
 import pandas as pd
-from typing import List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
 from dataclasses import dataclass
 
 
@@ -18,12 +19,21 @@ def save_to_sqlite(
     - if_exists: 'replace' (default) or 'append'.
 
     Note: Tables must be created with proper schema using init_database.py first.
+    'replace' deletes the existing rows but keeps that schema and its indexes.
     """
     if not rows:
         return
 
-    # Check if table exists with proper schema
+    # Convert dataclass instances to dicts if needed
+    if not isinstance(rows[0], dict):
+        rows = [row.__dict__ for row in rows]
+    # Union of keys in first-seen order; rows missing a key store NULL
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    column_list = ", ".join(columns)
+    placeholders = ", ".join("?" * len(columns))
+
     with sqlite3.connect(db_path) as conn:
+        # Check if table exists with proper schema
         cursor = conn.cursor()
         cursor.execute(
             f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}'"
@@ -34,23 +44,113 @@ def save_to_sqlite(
                 f"Please run 'python3 scripts/init_database.py' to create tables with proper schema."
             )
 
-    # Convert dataclass instances to dicts if needed
-    if not isinstance(rows[0], dict):
-        rows = [row.__dict__ for row in rows]
-    df = pd.DataFrame(rows)
+        if if_exists == "replace":
+            conn.execute(f"DELETE FROM {table_name}")
+        conn.executemany(
+            f"INSERT INTO {table_name} ({column_list}) VALUES ({placeholders})",
+            ([row.get(column) for column in columns] for row in rows),
+        )
+        conn.commit()
 
-    with sqlite3.connect(db_path) as conn:
-        df.to_sql(table_name, conn, if_exists=if_exists, index=False)
+
+# Case-insensitive building indexes for the location filter below. They match
+# the ones in scripts/init_database.py, which only runs for new databases.
+_NOCASE_INDEXES = {
+    "pnl_sms_by_month": (
+        "idx_pnl_building_nocase_year_month",
+        "(building_name COLLATE NOCASE, year, month)",
+    ),
+    "private_office_occupancies_by_building": (
+        "idx_occupancy_building_nocase_date",
+        "(building_name COLLATE NOCASE, date)",
+    ),
+}
+_nocase_indexes_checked = set()
+
+
+def _ensure_nocase_index(conn: sqlite3.Connection, table_name: str, db_path: str):
+    """Add the NOCASE building index to databases created before it existed."""
+    if (
+        table_name not in _NOCASE_INDEXES
+        or (db_path, table_name) in _nocase_indexes_checked
+    ):
+        return
+    _nocase_indexes_checked.add((db_path, table_name))
+    index_name, columns = _NOCASE_INDEXES[table_name]
+    try:
+        conn.execute(
+            f"CREATE INDEX IF NOT EXISTS {index_name} ON {table_name} {columns}"
+        )
+        conn.commit()
+    except sqlite3.Error:
+        # Missing table or read-only database: the query still works, just unindexed
+        pass
 
 
 def load_from_sqlite(
-    table_name: str, db_path: str = "data/zoho_data.db"
+    table_name: str,
+    db_path: str = "data/zoho_data.db",
+    location: Optional[str] = None,
 ) -> pd.DataFrame:
     """
     Load data from a SQLite table into a pandas DataFrame.
+    - location: If given, only rows whose building_name matches it
+      (case-insensitively) are read.
     """
+    query = f"SELECT * FROM {table_name}"
+    params: tuple = ()
+    if location is not None:
+        query += " WHERE building_name = ? COLLATE NOCASE"
+        params = (location,)
     with sqlite3.connect(db_path) as conn:
-        return pd.read_sql(f"SELECT * FROM {table_name}", conn)
+        if location is not None:
+            _ensure_nocase_index(conn, table_name, db_path)
+        return pd.read_sql_query(query, conn, params=params)
+
+
+def load_from_sqlite_filtered(
+    table_name: str,
+    year: int,
+    month: int,
+    location: Optional[str] = None,
+    history_months: int = 3,
+    db_path: str = "data/zoho_data.db",
+) -> pd.DataFrame:
+    """
+    Load the rows of a monthly table for year/month and the history_months
+    months before it, instead of the whole table.
+    - location: If given, only rows whose building_name matches it
+      (case-insensitively) are read.
+    Tables without year/month columns are loaded in full.
+    """
+    target_key = year * 12 + month
+    with sqlite3.connect(db_path) as conn:
+        columns = {row[1] for row in conn.execute(f"PRAGMA table_info({table_name})")}
+        if not {"year", "month"} <= columns:
+            return load_from_sqlite(table_name, db_path, location=location)
+        start_key = target_key - history_months
+        # The year range lets SQLite use the (year, month) index
+        query = (
+            f"SELECT * FROM {table_name} WHERE year BETWEEN ? AND ?"
+            " AND year * 12 + month BETWEEN ? AND ?"
+        )
+        params: tuple = ((start_key - 1) // 12, year, start_key, target_key)
+        if location is not None:
+            query += " AND building_name = ? COLLATE NOCASE"
+            params += (location,)
+            _ensure_nocase_index(conn, table_name, db_path)
+        return pd.read_sql_query(query, conn, params=params)
+
+
+def get_data_version(db_path: str = "data/zoho_data.db") -> Optional[int]:
+    """
+    Return a value that changes whenever the database file is written
+    (its modification time), or None if the file does not exist.
+    """
+    try:
+        return os.stat(db_path).st_mtime_ns
+    except OSError:
+        return None
 
 
 def delete_from_sqlite_by_year_month(
@@ -77,21 +177,19 @@ def delete_from_sqlite_by_range(
     """
     Delete rows from a SQLite table for a range of months/years (inclusive).
     """
-    # Build a list of (year, month) tuples in the range
-    ym = []
-    y, m = start_year, start_month
-    while (y < end_year) or (y == end_year and m <= end_month):
-        ym.append((y, m))
-        if m == 12:
-            y += 1
-            m = 1
-        else:
-            m += 1
+    # One statement over year*12+month keys instead of one DELETE per month;
+    # the year range lets SQLite use the (year, month) index
     with sqlite3.connect(db_path) as conn:
-        for year, month in ym:
-            conn.execute(
-                f"DELETE FROM {table_name} WHERE year = ? AND month = ?", (year, month)
-            )
+        conn.execute(
+            f"DELETE FROM {table_name} WHERE year BETWEEN ? AND ?"
+            " AND year * 12 + month BETWEEN ? AND ?",
+            (
+                start_year,
+                end_year,
+                start_year * 12 + start_month,
+                end_year * 12 + end_month,
+            ),
+        )
         conn.commit()
 
 
@@ -225,3 +323,37 @@ def get_published_price(
         if row:
             return float(row[0])
         return None
+
+
+def get_published_prices(
+    building_names: Iterable[str],
+    year: int,
+    month: int,
+    db_path: str = "data/zoho_data.db",
+) -> Dict[str, float]:
+    """
+    Get the published prices for many buildings for a year/month in one query.
+    Returns a dict of building_name -> price for buildings that have one, using
+    the same "most recent period covering year/month" rule as get_published_price.
+    """
+    names = list(dict.fromkeys(building_names))
+    prices: Dict[str, float] = {}
+    # Stay well under SQLite's bound-parameter limit
+    batch_size = 500
+    with sqlite3.connect(db_path) as conn:
+        for start in range(0, len(names), batch_size):
+            batch = names[start : start + batch_size]
+            placeholders = ", ".join("?" * len(batch))
+            query = f"""
+                SELECT building_name, price FROM published_prices
+                WHERE building_name IN ({placeholders})
+                  AND (year_from < ? OR (year_from = ? AND month_from <= ?))
+                  AND (year_to > ? OR (year_to = ? AND month_to >= ?))
+                ORDER BY year_from DESC, month_from DESC
+            """
+            cur = conn.execute(query, (*batch, year, year, month, year, year, month))
+            for building_name, price in cur:
+                # Rows are newest first; keep the first price seen per building
+                if building_name not in prices:
+                    prices[building_name] = float(price)
+    return prices
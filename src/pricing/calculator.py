@@ -1,13 +1,19 @@
 try:
     from src.pricing.models import (
         DynamicPricingTier,
+        TierTable,
         LocationData,
         PricingRules,
         PricingResult,
         ManualOverrideInfo,
         PricingCLIOutput,
     )
-    from src.pricing.rules import build_rules, get_target_breakeven_occupancy
+    from src.pricing.rules import (
+        build_rules,
+        calculate_smart_target_multiplier,
+        parse_dynamic_pricing_tiers,
+        resolve_target_breakeven_occupancy,
+    )
     from src.utils.parsing import (
         parse_float,
         parse_int,
@@ -19,13 +25,19 @@ except ImportError:
     # Fallback for when running the script directly
     from pricing.models import (
         DynamicPricingTier,
+        TierTable,
         LocationData,
         PricingRules,
         PricingResult,
         ManualOverrideInfo,
         PricingCLIOutput,
     )
-    from pricing.rules import build_rules, get_target_breakeven_occupancy
+    from pricing.rules import (
+        build_rules,
+        calculate_smart_target_multiplier,
+        parse_dynamic_pricing_tiers,
+        resolve_target_breakeven_occupancy,
+    )
     from utils.parsing import (
         parse_float,
         parse_int,
@@ -33,19 +45,27 @@ except ImportError:
         pct_to_decimal,
         decimal_to_pct,
     )
-from typing import Any, Dict
+import copy
+import logging
+import math
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
 
 
 class PricingCalculator:
     def __init__(self, config: Dict[str, Any]):
-        self.config = config
+        # Private copy: rules are memoized per location, so later edits to the
+        # caller's dict must not leave them out of sync with self.config
+        self.config = copy.deepcopy(config)
+        # Rules are built once per location and share the tiers, which are
+        # the same for every location of a config
+        self._tiers = parse_dynamic_pricing_tiers(config)
+        self._tier_table = TierTable.from_tiers(self._tiers)
+        self._rules: Dict[str, PricingRules] = {}
 
     def calculate_pricing(self, location_data: LocationData) -> PricingResult:
-        import logging
-
-        logger = logging.getLogger(__name__)
-
-        rules = build_rules(location_data.name, self.config)
+        rules = self._get_rules(location_data.name)
 
         # Calculate actual breakeven occupancy pct if possible
         actual_breakeven_occupancy_pct = None
@@ -67,11 +87,12 @@ class PricingCalculator:
                 actual_breakeven_occupancy_pct = None
 
         # Get target breakeven occupancy (smart or static)
-        target_breakeven_occupancy, is_smart_target = get_target_breakeven_occupancy(
-            location_data.name,
-            self.config,
-            actual_breakeven_occupancy_pct,
-            location_data.po_seats_occupied_actual_pct,
+        target_breakeven_occupancy, is_smart_target = (
+            resolve_target_breakeven_occupancy(
+                rules,
+                actual_breakeven_occupancy_pct,
+                location_data.po_seats_occupied_actual_pct,
+            )
         )
 
         # Log smart target usage
@@ -99,7 +120,7 @@ class PricingCalculator:
         step2, dynamic_multiplier = self._apply_dynamic_multiplier(
             step1,
             location_data.po_seats_occupied_actual_pct,
-            rules.dynamic_pricing_tiers,
+            self._get_tier_table(rules),
         )
         step3 = self._apply_margin_of_safety(step2, rules.margin_of_safety)
         step4_rounded = self._round_to_nearest(step3)
@@ -131,7 +152,6 @@ class PricingCalculator:
             base_price=step2,
             price_with_margin=step3,
             final_price=step4,
-            losing_money=losing_money,
             dynamic_multiplier=dynamic_multiplier,
             is_smart_target=is_smart_target,  # Add smart target indicator
         )
@@ -152,12 +172,10 @@ class PricingCalculator:
     def _apply_dynamic_multiplier(
         self, breakeven_price: float, occupancy_pct: float, tiers
     ) -> tuple[float, float]:
-        multiplier = 1.0
-        for tier in tiers:
-            # Both occupancy_pct and tier values are now in percentage format (0-100)
-            if tier.min_occupancy < occupancy_pct <= tier.max_occupancy:
-                multiplier = tier.multiplier
-                break
+        if not isinstance(tiers, TierTable):
+            tiers = TierTable.from_tiers(tiers)
+        # Both occupancy_pct and tier values are in percentage format (0-100)
+        multiplier = tiers.multiplier_for(occupancy_pct)
         return breakeven_price * multiplier, multiplier
 
     def _apply_margin_of_safety(
@@ -179,8 +197,6 @@ class PricingCalculator:
 
     def _round_up_to_nearest(self, value: float, nearest: int) -> float:
         """Round value up to the nearest multiple of 'nearest'."""
-        import math
-
         # If value is already a multiple of 'nearest', return as is
         if value % nearest == 0:
             return value
@@ -201,33 +217,17 @@ class PricingCalculator:
         Returns:
             float: Improvement multiplier (e.g., 0.95 means 5% reduction in target)
         """
-        # Calculate profitability status
-        is_profitable = current_occupancy_pct >= breakeven_occupancy_pct
-
-        if is_profitable:
-            # Profitable locations - More aggressive targets (3-7% reduction)
-            if breakeven_occupancy_pct <= 50:
-                return 0.97  # 3% reduction (already very efficient)
-            elif breakeven_occupancy_pct <= 70:
-                return 0.95  # 5% reduction (good room for improvement)
-            else:
-                return 0.93  # 7% reduction (high breakeven = lots of room)
-        else:
-            # Losing money locations - Less aggressive targets (3-10% reduction)
-            loss_gap = breakeven_occupancy_pct - current_occupancy_pct
-
-            if loss_gap <= 15:
-                return 0.97  # 3% reduction (achievable target)
-            elif loss_gap <= 25:
-                return 0.94  # 6% reduction (challenging but realistic)
-            else:
-                return 0.90  # 10% reduction (aggressive but not impossible)
+        return calculate_smart_target_multiplier(
+            breakeven_occupancy_pct, current_occupancy_pct
+        )
 
     def calculate_smart_target_with_fallback(
         self,
         location_name: str,
         actual_breakeven_occupancy_pct: float,
         current_occupancy_pct: float,
+        rules: Optional[PricingRules] = None,
+        static_target: Optional[float] = None,
     ) -> tuple[float, bool]:
         """
         Calculate smart target breakeven occupancy with fallback to static target.
@@ -236,18 +236,20 @@ class PricingCalculator:
             location_name: Name of the location
             actual_breakeven_occupancy_pct: Current actual breakeven occupancy percentage
             current_occupancy_pct: Current occupancy percentage
+            rules: Optional pre-built rules for the location (avoids re-parsing config)
+            static_target: Optional pre-computed static target for the location
 
         Returns:
             tuple[float, bool]: (target_breakeven_occupancy, is_smart_target)
         """
+        if static_target is None:
+            static_target = self._get_rules(location_name).target_breakeven_occupancy
+
         try:
             # Check if smart targets are enabled for this location
-            rules = build_rules(location_name, self.config)
+            if rules is None:
+                rules = self._get_rules(location_name)
             if not rules.use_smart_target:
-                # Use static target
-                static_target = get_target_breakeven_occupancy(
-                    location_name, self.config
-                )
                 return static_target, False
 
             # Validate inputs for smart target calculation
@@ -265,7 +267,22 @@ class PricingCalculator:
 
             return smart_target, True
 
-        except Exception as e:
-            # Fallback to static target on any error
-            static_target = get_target_breakeven_occupancy(location_name, self.config)
+        except (KeyError, TypeError, ValueError, ZeroDivisionError):
+            # Fallback to static target on invalid config or data
             return static_target, False
+
+    def _get_rules(self, location_name: str) -> PricingRules:
+        """Return the parsed pricing rules for a location (memoized)."""
+        rules = self._rules.get(location_name)
+        if rules is None:
+            rules = build_rules(
+                location_name, self.config, self._tiers, self._tier_table
+            )
+            self._rules[location_name] = rules
+        return rules
+
+    def _get_tier_table(self, rules: PricingRules) -> TierTable:
+        """Return the tier lookup table precomputed by build_rules."""
+        if rules.tier_table is not None:
+            return rules.tier_table
+        return TierTable.from_tiers(rules.dynamic_pricing_tiers)
@@ -50,9 +50,9 @@ class GoogleChatFormatter(ResponseFormatterInterface):
         def format_price(price: Optional[float], nearest: int = 1) -> str:
             if price is None:
                 return "Not set"
-            import math
-
-            return f"{int(round(price / nearest) * nearest):,}"
+            if nearest == 1:
+                return f"{price:,.0f}"
+            return f"{round(price / nearest) * nearest:,.0f}"
 
         breakeven_target_pct = pricing_data.target_breakeven_occupancy_pct
         breakeven_actual_pct = pricing_data.actual_breakeven_occupancy_pct
@@ -1,36 +1,93 @@
+from bisect import bisect_left
+from dataclasses import InitVar, dataclass, field
 from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 
 
-class DynamicPricingTier(BaseModel):
+# Internal models are slotted dataclasses: they are built once per location per
+# run from already-validated config/data, so Pydantic validation is reserved for
+# the API boundary (PricingCLIOutput).
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DynamicPricingTier:
     min_occupancy: float
     max_occupancy: float
     multiplier: float
 
 
-class LocationData(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TierTable:
+    """Dynamic pricing tiers laid out as parallel tuples for fast lookup."""
+
+    min_occupancy: Tuple[float, ...]
+    max_occupancy: Tuple[float, ...]
+    multiplier: Tuple[float, ...]
+    # True when tiers are ascending and non-overlapping, enabling binary search
+    ordered: bool
+
+    @classmethod
+    def from_tiers(cls, tiers: Sequence[DynamicPricingTier]) -> "TierTable":
+        min_occ = tuple(float(t.min_occupancy) for t in tiers)
+        max_occ = tuple(float(t.max_occupancy) for t in tiers)
+        ordered = all(
+            min_occ[i] >= max_occ[i - 1] for i in range(1, len(max_occ))
+        ) and all(lo <= hi for lo, hi in zip(min_occ, max_occ))
+        return cls(
+            min_occupancy=min_occ,
+            max_occupancy=max_occ,
+            multiplier=tuple(float(t.multiplier) for t in tiers),
+            ordered=ordered,
+        )
+
+    def multiplier_for(self, occupancy_pct: float) -> float:
+        """Return the multiplier of the first tier with min < occupancy <= max."""
+        if self.ordered:
+            idx = bisect_left(self.max_occupancy, occupancy_pct)
+            if (
+                idx < len(self.max_occupancy)
+                and self.min_occupancy[idx] < occupancy_pct
+            ):
+                return self.multiplier[idx]
+            return 1.0
+        for lo, hi, mult in zip(
+            self.min_occupancy, self.max_occupancy, self.multiplier
+        ):
+            if lo < occupancy_pct <= hi:
+                return mult
+        return 1.0
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class LocationData:
     name: str
-    exp_total_po_expense_amount: float
     avg_exp_total_po_expense_amount: float
     # Updated to use daily occupancy data from private_office_occupancies_by_building table
     po_seats_occupied_actual_pct: float  # Daily occupancy percentage
-    po_seats_occupied_pct: Optional[float] = None  # Keep for backward compatibility
     total_po_seats: int
     published_price: Optional[float] = None
     sold_price_per_po_seat_actual: Optional[float] = (
         None  # Current sold price per PO seat (actual) from pnl_sms_by_month
     )
+    # Legacy inputs, accepted for backward compatibility but not stored
+    exp_total_po_expense_amount: InitVar[Optional[float]] = None
+    po_seats_occupied_pct: InitVar[Optional[float]] = None
 
 
-class PricingRules(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PricingRules:
     min_price: Optional[float]
     max_price: Optional[float]
     margin_of_safety: float
     dynamic_pricing_tiers: List[DynamicPricingTier]
     use_smart_target: bool
+    # Static target, resolved from config with the same 70% default as
+    # get_target_breakeven_occupancy()
+    target_breakeven_occupancy: Optional[float] = 70.0
+    # Precomputed lookup table for dynamic_pricing_tiers, shared per config
+    tier_table: Optional[TierTable] = field(default=None, repr=False, compare=False)
 
 
-class PricingResult(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class PricingResult:
     location: str
     recommended_price: float
     manual_override: Optional[Dict[str, Any]] = None
@@ -47,10 +104,14 @@ class PricingResult(BaseModel):
     base_price: Optional[float] = None
     price_with_margin: Optional[float] = None
     final_price: Optional[float] = None
-    losing_money: Optional[bool] = None
     dynamic_multiplier: Optional[float] = None
     is_smart_target: Optional[bool] = None  # Track whether smart targets were used
 
+    @property
+    def losing_money(self) -> bool:
+        """Deprecated alias for is_losing_money."""
+        return self.is_losing_money
+
 
 class ManualOverrideInfo(BaseModel):
     overridden_price: float
@@ -80,3 +141,8 @@ class PricingCLIOutput(BaseModel):
         None  # Actual sold price per PO seat, for display
     )
     is_smart_target: Optional[bool] = None  # Track whether smart targets were used
+
+    @classmethod
+    def fast_new(cls, **fields: Any) -> "PricingCLIOutput":
+        """Build from trusted, already-computed values without re-validating them."""
+        return cls.model_construct(**fields)
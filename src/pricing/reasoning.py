@@ -3,7 +3,9 @@ llm_reasoning.py - Module for generating LLM-based reasoning for price recommend
 """
 
 import os
-import openai
+from functools import lru_cache
+
+_UNAVAILABLE_PREFIX = "[LLM reasoning unavailable"
 
 
 def generate_llm_reasoning(context: dict) -> str:
@@ -17,6 +19,9 @@ def generate_llm_reasoning(context: dict) -> str:
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         return "[LLM reasoning unavailable: OPENAI_API_KEY not set]"
+    # Imported lazily: openai is slow to import and only needed in verbose runs
+    import openai
+
     client = openai.OpenAI(api_key=api_key)
     location = context.get("location")
     recommended_price = context.get("recommended_price")
@@ -54,3 +59,65 @@ def generate_llm_reasoning(context: dict) -> str:
         return response.choices[0].message.content.strip()
     except Exception as e:
         return f"[LLM reasoning unavailable: {e}]"
+
+
+class _ReasoningUnavailable(Exception):
+    """Carries a fallback message out of the cache so it is not memoized."""
+
+
+def _reasoning_cache_key(context: dict) -> tuple:
+    # Floats are rounded so that tiny numeric noise does not defeat the cache
+    return tuple(
+        sorted(
+            (k, round(v, 2) if isinstance(v, float) else v) for k, v in context.items()
+        )
+    )
+
+
+class _CacheKey:
+    """Hashes and compares by the rounded key, but keeps the original context."""
+
+    __slots__ = ("context", "key", "_hash")
+
+    def __init__(self, context: dict):
+        self.context = context
+        self.key = _reasoning_cache_key(context)
+        # Raises TypeError for unhashable context values
+        self._hash = hash(self.key)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _CacheKey) and self.key == other.key
+
+
+@lru_cache(maxsize=512)
+def _cached_llm_reasoning(cache_key: _CacheKey) -> str:
+    # The prompt is built from the unrounded context of the first caller
+    result = generate_llm_reasoning(cache_key.context)
+    if result.startswith(_UNAVAILABLE_PREFIX):
+        raise _ReasoningUnavailable(result)
+    return result
+
+
+def generate_llm_reasoning_cached(context: dict) -> str:
+    """
+    Same as generate_llm_reasoning, but reuses earlier answers for an
+    identical context. Fallback messages are never cached, so a missing
+    key or a transient API error is retried on the next call. Contexts
+    that cannot be hashed are passed straight through without caching.
+    """
+    try:
+        cache_key = _CacheKey(context)
+    except TypeError:
+        return generate_llm_reasoning(context)
+    try:
+        return _cached_llm_reasoning(cache_key)
+    except _ReasoningUnavailable as e:
+        return str(e)
+
+
+def clear_cache() -> None:
+    """Forget all cached LLM reasoning."""
+    _cached_llm_reasoning.cache_clear()
@@ -1,10 +1,25 @@
 # src/pricing/rules.py
-from typing import Dict, Any
-from .models import PricingRules, DynamicPricingTier
+from typing import Dict, Any, List, Mapping, Optional
+from .models import PricingRules, DynamicPricingTier, TierTable
 
 
-def build_rules(location: str, cfg: Dict[str, Any]) -> PricingRules:
-    """Translate raw YAML config into a strongly-typed PricingRules object."""
+def parse_dynamic_pricing_tiers(cfg: Mapping[str, Any]) -> List[DynamicPricingTier]:
+    """Parse the dynamic pricing tiers shared by all locations of a config."""
+    return [DynamicPricingTier(**tier) for tier in cfg.get("dynamic_pricing_tiers", [])]
+
+
+def build_rules(
+    location: str,
+    cfg: Dict[str, Any],
+    tiers: Optional[List[DynamicPricingTier]] = None,
+    tier_table: Optional[TierTable] = None,
+) -> PricingRules:
+    """
+    Translate raw YAML config into a strongly-typed PricingRules object.
+
+    Callers building rules for many locations of the same config can pass the
+    already parsed tiers and tier table so they are shared instead of rebuilt.
+    """
     loc_cfg = cfg.get("locations", {}).get(location, {})
 
     # Validate smart target configuration
@@ -23,19 +38,55 @@ def build_rules(location: str, cfg: Dict[str, Any]) -> PricingRules:
                 f"value: {static_target}. Must be a positive number."
             )
 
+    if tiers is None:
+        tiers = parse_dynamic_pricing_tiers(cfg)
+    if tier_table is None:
+        tier_table = TierTable.from_tiers(tiers)
     return PricingRules(
         min_price=loc_cfg.get("min_price"),
         max_price=loc_cfg.get("max_price"),
         margin_of_safety=loc_cfg.get(
             "margin_of_safety", cfg.get("margin_of_safety", 0.5)
         ),
-        dynamic_pricing_tiers=[
-            DynamicPricingTier(**tier) for tier in cfg.get("dynamic_pricing_tiers", [])
-        ],
+        dynamic_pricing_tiers=tiers,
         use_smart_target=use_smart_target,
+        target_breakeven_occupancy=loc_cfg.get("target_breakeven_occupancy", 70.0),
+        tier_table=tier_table,
     )
 
 
+def calculate_smart_target_multiplier(
+    actual_breakeven_occupancy_pct: float, current_occupancy_pct: float
+) -> float:
+    """
+    Calculate the smart target improvement multiplier from profitability status.
+
+    Args:
+        actual_breakeven_occupancy_pct: Current actual breakeven occupancy percentage
+        current_occupancy_pct: Current occupancy percentage
+
+    Returns:
+        float: Improvement multiplier (e.g., 0.95 means 5% reduction in target)
+    """
+    if current_occupancy_pct >= actual_breakeven_occupancy_pct:
+        # Profitable locations - More aggressive targets (3-7% reduction)
+        if actual_breakeven_occupancy_pct <= 50:
+            return 0.97  # 3% reduction (already very efficient)
+        elif actual_breakeven_occupancy_pct <= 70:
+            return 0.95  # 5% reduction (good room for improvement)
+        else:
+            return 0.93  # 7% reduction (high breakeven = lots of room)
+
+    # Losing money locations - Less aggressive targets (3-10% reduction)
+    loss_gap = actual_breakeven_occupancy_pct - current_occupancy_pct
+    if loss_gap <= 15:
+        return 0.97  # 3% reduction (achievable target)
+    elif loss_gap <= 25:
+        return 0.94  # 6% reduction (challenging but realistic)
+    else:
+        return 0.90  # 10% reduction (aggressive but not impossible)
+
+
 def get_target_breakeven_occupancy(
     location: str,
     cfg: Dict[str, Any],
@@ -54,53 +105,42 @@ def get_target_breakeven_occupancy(
     Returns:
         tuple[float, bool]: (target_breakeven_occupancy, is_smart_target)
     """
-    loc_cfg = cfg.get("locations", {}).get(location, {})
-    use_smart_target = loc_cfg.get("use_smart_target")
-    if use_smart_target is None:
-        raise ValueError(
-            f"Location '{location}' must have 'use_smart_target' configured"
-        )
+    return resolve_target_breakeven_occupancy(
+        build_rules(location, cfg),
+        actual_breakeven_occupancy_pct,
+        current_occupancy_pct,
+    )
+
+
+def resolve_target_breakeven_occupancy(
+    rules: PricingRules,
+    actual_breakeven_occupancy_pct: float = None,
+    current_occupancy_pct: float = None,
+) -> tuple[float, bool]:
+    """
+    Resolve the target breakeven occupancy from already-built rules.
+
+    Args:
+        rules: Pricing rules for the location
+        actual_breakeven_occupancy_pct: Current actual breakeven occupancy percentage (for smart targets)
+        current_occupancy_pct: Current occupancy percentage (for smart targets)
 
+    Returns:
+        tuple[float, bool]: (target_breakeven_occupancy, is_smart_target)
+    """
     # If smart targets are enabled and we have the required data, calculate smart target
     if (
-        use_smart_target
+        rules.use_smart_target
         and actual_breakeven_occupancy_pct is not None
         and current_occupancy_pct is not None
     ):
-        # Calculate smart target directly to avoid circular imports
-        try:
-            # Calculate profitability status
-            is_profitable = current_occupancy_pct >= actual_breakeven_occupancy_pct
-
-            if is_profitable:
-                # Profitable locations - More aggressive targets (3-7% reduction)
-                if actual_breakeven_occupancy_pct <= 50:
-                    improvement_multiplier = 0.97  # 3% reduction
-                elif actual_breakeven_occupancy_pct <= 70:
-                    improvement_multiplier = 0.95  # 5% reduction
-                else:
-                    improvement_multiplier = 0.93  # 7% reduction
-            else:
-                # Losing money locations - Less aggressive targets (3-10% reduction)
-                loss_gap = actual_breakeven_occupancy_pct - current_occupancy_pct
-
-                if loss_gap <= 15:
-                    improvement_multiplier = 0.97  # 3% reduction
-                elif loss_gap <= 25:
-                    improvement_multiplier = 0.94  # 6% reduction
-                else:
-                    improvement_multiplier = 0.90  # 10% reduction
-
-            smart_target = actual_breakeven_occupancy_pct * improvement_multiplier
-            return smart_target, True
-
-        except Exception:
-            # Fallback to static target on any error
-            pass
+        improvement_multiplier = calculate_smart_target_multiplier(
+            actual_breakeven_occupancy_pct, current_occupancy_pct
+        )
+        return actual_breakeven_occupancy_pct * improvement_multiplier, True
 
     # Fallback to static target
-    static_target = loc_cfg.get("target_breakeven_occupancy", 70.0)  # Default fallback
-    return static_target, False
+    return rules.target_breakeven_occupancy, False
 
 
 def is_smart_target_enabled(location: str, cfg: Dict[str, Any]) -> bool:
@@ -7,75 +7,111 @@ SOLID principles.
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import date, datetime
+from functools import lru_cache
 import pandas as pd
 import logging
-from pydantic import BaseModel
+import threading
+import time
 
 try:
-    from src.pricing.models import PricingCLIOutput, LocationData, PricingRules
+    from src.pricing.models import PricingCLIOutput, LocationData
     from src.pricing.calculator import PricingCalculator
-    from src.pricing.rules import build_rules
-    from src.pricing.reasoning import generate_llm_reasoning
-    from src.data.storage import load_from_sqlite, get_published_price
-    from src.config.rules import load_pricing_rules
+    from src.pricing.reasoning import generate_llm_reasoning_cached
+    from src.data.storage import get_data_version, get_published_prices
+    from src.config.rules import load_pricing_rules, clear_cache as clear_config_cache
     from src.data.loader import DataLoaderService
-    from src.utils.parsing import parse_float, parse_int, parse_pct
+    from src.utils.parsing import (
+        parse_float,
+        parse_float_series,
+        parse_int,
+        parse_int_series,
+        parse_pct,
+        parse_pct_series,
+    )
     from src.utils.error_handler import (
         handle_errors,
         error_boundary,
         safe_parse,
-        validate_required_field,
-        log_and_continue,
         create_error_context,
     )
-    from src.exceptions import (
-        DataNotFoundException,
-        DataValidationException,
-        CalculationException,
-        LLMServiceException,
-        ParsingException,
-    )
 except ImportError:
     # Fallback for when running the script directly
-    from pricing.models import PricingCLIOutput, LocationData, PricingRules
+    from pricing.models import PricingCLIOutput, LocationData
     from pricing.calculator import PricingCalculator
-    from pricing.rules import build_rules
-    from pricing.reasoning import generate_llm_reasoning
-    from data.storage import load_from_sqlite, get_published_price
-    from config.rules import load_pricing_rules
+    from pricing.reasoning import generate_llm_reasoning_cached
+    from data.storage import get_data_version, get_published_prices
+    from config.rules import load_pricing_rules, clear_cache as clear_config_cache
     from data.loader import DataLoaderService
-    from utils.parsing import parse_float, parse_int, parse_pct
+    from utils.parsing import (
+        parse_float,
+        parse_float_series,
+        parse_int,
+        parse_int_series,
+        parse_pct,
+        parse_pct_series,
+    )
     from utils.error_handler import (
         handle_errors,
         error_boundary,
         safe_parse,
-        validate_required_field,
-        log_and_continue,
         create_error_context,
     )
-    from exceptions import (
-        DataNotFoundException,
-        DataValidationException,
-        CalculationException,
-        LLMServiceException,
-        ParsingException,
-    )
+
+
+# Occupancy columns tried by _get_occupancy_with_fallback, in order of preference
+_OCCUPANCY_COLUMNS = (
+    "po_seats_occupied_actual_pct",
+    "po_seats_actual_occupied_pct",
+    "po_seats_occupied_pct",
+)
+
+# Loaded DataFrames are reused for repeat requests within this window, as long
+# as the database has not been written since (see get_data_version)
+_DATA_CACHE_TTL_SECONDS = 300
+_DATA_CACHE_MAXSIZE = 32
+
+# Upper bound on concurrent LLM reasoning requests in verbose runs
+_LLM_MAX_CONCURRENCY = 16
+
+
+@lru_cache(maxsize=64)
+def _target_date_str(year: int, month: int) -> str:
+    """Return the first day of the month as 'YYYY-MM-DD'."""
+    return f"{year}-{month:02d}-01"
+
+
+def _occupancy_context(location: str):
+    """Error context for occupancy parsing, built only when a fallback needs it."""
+    return create_error_context("calculate_occupancy", location, "daily_data")
+
+
+def _group_by_location(df: pd.DataFrame, locations: set) -> Dict[str, pd.DataFrame]:
+    """Split the rows of the given locations into one DataFrame per location."""
+    if not locations:
+        return {}
+    subset = df[df["building_name"].isin(locations)]
+    return {
+        location: rows
+        for location, rows in subset.groupby("building_name", sort=False, observed=True)
+    }
 
 
 class PricingServiceInterface(ABC):
     """Abstract interface for pricing operations following Interface Segregation Principle."""
 
     @abstractmethod
-    async def get_pricing_for_location(
+    def get_pricing_for_location(
         self, location: str, year: Optional[int] = None, month: Optional[int] = None
     ) -> Optional[PricingCLIOutput]:
         """Get pricing data for a specific location and time period."""
         pass
 
     @abstractmethod
-    async def get_pricing_for_all_locations(
+    def get_pricing_for_all_locations(
         self, year: Optional[int] = None, month: Optional[int] = None
     ) -> List[PricingCLIOutput]:
         """Get pricing data for all locations in a time period."""
@@ -110,6 +146,13 @@ class PricingService(PricingServiceInterface):
         self._config = None
         self._data_loader = DataLoaderService()
         self._logger = logging.getLogger(__name__)
+        # (target_date, location) -> (loaded_at, data_version, DataFrame)
+        self._data_cache: "OrderedDict[Tuple, Tuple[float, Any, pd.DataFrame]]" = (
+            OrderedDict()
+        )
+        self._data_cache_lock = threading.Lock()
+        # Reused while callers pass a config equal to the one it was built from
+        self._calculator: Optional[PricingCalculator] = None
 
     def _load_config(self) -> Dict[str, Any]:
         """Load pricing configuration (lazy loading)."""
@@ -117,14 +160,56 @@ class PricingService(PricingServiceInterface):
             self._config = load_pricing_rules()
         return self._config
 
+    def _get_calculator(self, config: Dict[str, Any]) -> PricingCalculator:
+        """Return a calculator for config, reusing the last one if config is unchanged."""
+        cached = self._calculator
+        # Compared by value, so a config edited in place gets a fresh calculator
+        if cached is not None and cached.config == config:
+            return cached
+        calculator = PricingCalculator(config)
+        self._calculator = calculator
+        return calculator
+
     def _load_data(
         self, target_date: Optional[str] = None, location: Optional[str] = None
     ) -> pd.DataFrame:
-        """Load pricing data using DataLoaderService (lazy loading)."""
-        return self._data_loader.load_merged_pricing_data(
+        """Load pricing data using DataLoaderService (cached with a TTL)."""
+        key = (target_date, location)
+        now = time.monotonic()
+        # Taken before loading, so writes made during the load (including its
+        # own auto-fetch) cause a reload next time rather than being missed
+        version = get_data_version()
+        with self._data_cache_lock:
+            entry = self._data_cache.get(key)
+            if (
+                entry is not None
+                and now - entry[0] < _DATA_CACHE_TTL_SECONDS
+                and entry[1] == version
+            ):
+                self._data_cache.move_to_end(key)
+                return entry[2]
+
+        df = self._data_loader.load_merged_pricing_data(
             target_date, location, auto_fetch=True
         )
 
+        # Don't cache empty results so newly fetched data shows up immediately
+        if not df.empty:
+            with self._data_cache_lock:
+                self._data_cache[key] = (now, version, df)
+                self._data_cache.move_to_end(key)
+                while len(self._data_cache) > _DATA_CACHE_MAXSIZE:
+                    self._data_cache.popitem(last=False)
+        return df
+
+    def cache_clear(self) -> None:
+        """Drop cached configuration and data so the next request reloads them."""
+        with self._data_cache_lock:
+            self._data_cache.clear()
+        self._config = None
+        self._calculator = None
+        clear_config_cache()
+
     def _get_occupancy_with_fallback(self, row, context=None):
         """
         Get occupancy percentage with fallback logic for different column names.
@@ -136,21 +221,34 @@ class PricingService(PricingServiceInterface):
         Returns:
             float: Parsed occupancy percentage or None if not available
         """
-        # Try different column names in order of preference
-        columns_to_try = [
-            "po_seats_occupied_actual_pct",
-            "po_seats_actual_occupied_pct",
-            "po_seats_occupied_pct",
-        ]
-
-        for col in columns_to_try:
-            if col in row and row[col] is not None:
+        for col in _OCCUPANCY_COLUMNS:
+            if row.get(col) is not None:
                 parsed = safe_parse(parse_pct, row[col], f"occupancy_{col}", context)
                 if parsed is not None:
                     return parsed
 
         return None
 
+    def _vectorize_numerics(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add pre-parsed numeric columns for the per-location fields.
+
+        _total_po_seats and _sold_price_per_po_seat_actual hold the parsed
+        values, or NaN where the value is missing or not a plain number; those
+        rows fall back to the scalar parsers so edge cases behave as before.
+        """
+        parsers = {
+            "total_po_seats": parse_int_series,
+            "sold_price_per_po_seat_actual": parse_float_series,
+        }
+        numerics = {}
+        for column, parser in parsers.items():
+            if column in df.columns:
+                numerics[f"_{column}"] = parser(df[column])
+            else:
+                numerics[f"_{column}"] = float("nan")
+        return df.assign(**numerics)
+
     @handle_errors(
         operation="pricing_pipeline",
         default_return=[],
@@ -180,6 +278,7 @@ class PricingService(PricingServiceInterface):
             target_date: Target date for daily occupancy data in 'YYYY-MM-DD' format (default: today).
             verbose: Whether to include LLM reasoning in output.
             auto_fetch: Whether to automatically fetch daily occupancy data from Zoho if not available (default: True).
+            target_location: Optional location to price; other locations are ignored (case-insensitive).
         """
         outputs: List[PricingCLIOutput] = []
 
@@ -212,178 +311,194 @@ class PricingService(PricingServiceInterface):
         if target_month is None:
             target_month = now.month
 
-        # Normalize building names to avoid trailing spaces or invisible characters
-        input_df["building_name"] = input_df["building_name"].astype(str).str.strip()
+        # Normalize building names to avoid trailing spaces or invisible characters.
+        # Work on a copy so cached DataFrames passed in by callers stay untouched.
+        # As a categorical, the dedupe/groupby/filter steps below work on integer
+        # codes instead of comparing strings.
+        input_df = input_df.assign(
+            building_name=input_df["building_name"]
+            .astype(str)
+            .str.strip()
+            .astype("category")
+        )
 
-        calculator = PricingCalculator(config)
+        # Narrow to the requested location before any grouping, so a
+        # single-location run only touches that location's rows
+        if target_location:
+            target = target_location.strip().lower()
+            names = input_df["building_name"].cat.categories
+            input_df = input_df[
+                input_df["building_name"].isin(
+                    [name for name in names if name.lower() == target]
+                )
+            ]
+            if input_df.empty:
+                self._logger.warning(f"No data available for {target_location}")
+                return outputs
+
+        calculator = self._get_calculator(config)
+
+        # Each location's first row supplies its single-row fields. Rows are
+        # plain dicts, which are much cheaper to build and read than Series.
+        # Blank names and the "holding" entity are not priced locations, so
+        # they are dropped here by category rather than checked per iteration.
+        first_rows = input_df.drop_duplicates(subset="building_name", keep="first")
+        skipped = [
+            name
+            for name in input_df["building_name"].cat.categories
+            if not name or name.lower() == "holding"
+        ]
+        if skipped:
+            first_rows = first_rows[~first_rows["building_name"].isin(skipped)]
+        first_rows = self._vectorize_numerics(first_rows)
+
+        # Average daily occupancy for every location in one vectorized pass.
+        # Locations with values the fast parser rejects keep the row-by-row
+        # path below, so invalid data is reported exactly as before.
+        daily_averages: Dict[str, float] = {}
+        unparsed_daily_locations = set()
+        unparsed_daily_rows: Dict[str, pd.DataFrame] = {}
+        if "po_seats_occupied_actual_pct" in input_df.columns:
+            daily_df = input_df[input_df["po_seats_occupied_actual_pct"].notna()]
+            parsed_pct = parse_pct_series(daily_df["po_seats_occupied_actual_pct"])
+            unparsed_daily_locations = set(
+                daily_df.loc[parsed_pct.isna(), "building_name"]
+            )
+            # Rows for those locations, grouped once instead of masked per location
+            unparsed_daily_rows = _group_by_location(daily_df, unparsed_daily_locations)
+            parsed_df = daily_df.assign(_occupancy_pct=parsed_pct)
+            parsed_df = parsed_df[
+                ~parsed_df["building_name"].isin(unparsed_daily_locations)
+            ]
+            if not parsed_df.empty:
+                daily_averages = (
+                    parsed_df.groupby("building_name", sort=False, observed=True)[
+                        "_occupancy_pct"
+                    ]
+                    .mean()
+                    .to_dict()
+                )
 
-        # Process only unique locations to avoid duplicates
-        processed_locations = set()
+        # Average the last three months of expenses per location in one pass.
+        # Locations with missing or unparsable values keep the row-by-row path
+        # below, so they are handled exactly as before.
+        monthly_df = input_df[
+            (input_df["year"] == target_year)
+            & (
+                input_df["month"].isin(
+                    [target_month - 2, target_month - 1, target_month]
+                )
+            )
+        ]
+        monthly_expenses = parse_float_series(
+            monthly_df["exp_total_po_expense_amount"], absolute=True
+        )
+        unparsed_expense_locations = set(
+            monthly_df.loc[monthly_expenses.isna(), "building_name"]
+        )
+        unparsed_expense_rows = _group_by_location(
+            monthly_df, unparsed_expense_locations
+        )
+        average_expenses = (
+            monthly_expenses.groupby(
+                monthly_df["building_name"], sort=False, observed=True
+            )
+            .mean()
+            .to_dict()
+        )
 
-        for _, row in input_df.iterrows():
-            loc = str(row["building_name"]).strip()
+        # Fetch published prices for every location with a single query
+        published_prices = get_published_prices(
+            first_rows["building_name"], target_year, target_month
+        )
 
-            # Skip if we've already processed this location
-            if loc in processed_locations:
-                continue
-            processed_locations.add(loc)
+        # Outputs that still need LLM reasoning, filled in after the loop
+        reasoning_jobs: List[Tuple[PricingCLIOutput, Dict[str, Any]]] = []
 
-            total_po_seats = (
-                parse_int(row.get("total_po_seats"))
-                if row.get("total_po_seats") not in [None, "None", "", "nan"]
-                else 0
-            )
+        for row in first_rows.to_dict("records"):
+            loc = row["building_name"]
+
+            total_po_seats = row["_total_po_seats"]
+            if pd.isna(total_po_seats):
+                total_po_seats = (
+                    parse_int(row.get("total_po_seats"))
+                    if row.get("total_po_seats") not in [None, "None", "", "nan"]
+                    else 0
+                )
+            else:
+                total_po_seats = int(total_po_seats)
 
-            if not loc:
-                continue
-            if str(loc).strip().lower() == "holding":
-                continue
             if total_po_seats == 0:
                 continue
 
-            # Calculate 7-day average occupancy for this location
-            context = create_error_context("calculate_occupancy", loc, "daily_data")
-
-            if "po_seats_occupied_actual_pct" in input_df.columns:
-                location_daily_data = input_df[
-                    (input_df["building_name"] == loc)
-                    & (input_df["po_seats_occupied_actual_pct"].notna())
+            # Calculate 7-day average occupancy for this location. The error
+            # context is only built on the slower fallback paths that use it.
+            if loc in daily_averages:
+                occupancy_pct = round(daily_averages[loc], 1)
+            elif loc in unparsed_daily_locations:
+                context = _occupancy_context(loc)
+                location_daily_data = unparsed_daily_rows[loc]
+                daily_occupancies = [
+                    safe_parse(parse_pct, occ, "occupancy_percentage", context)
+                    for occ in location_daily_data["po_seats_occupied_actual_pct"]
                 ]
+                occupancy_pct = round(
+                    sum(daily_occupancies) / len(daily_occupancies), 1
+                )
             else:
-                # If the column doesn't exist, use empty DataFrame
-                location_daily_data = pd.DataFrame()
-
-            # Use daily occupancy data if available, fallback to monthly
-            if not location_daily_data.empty:
-                # Calculate 7-day average occupancy
-                daily_occupancies = []
-                for occ in location_daily_data["po_seats_occupied_actual_pct"]:
-                    parsed = safe_parse(parse_pct, occ, "occupancy_percentage", context)
-                    if parsed is not None:
-                        daily_occupancies.append(parsed)
-                    else:
-                        log_and_continue(
-                            ParsingException(
-                                "occupancy_percentage", occ, "Invalid format", context
-                            ),
-                            "parse_occupancy",
-                            loc,
-                            logging.WARNING,
-                        )
-
-                if daily_occupancies:
-                    occupancy_pct = round(
-                        sum(daily_occupancies) / len(daily_occupancies), 1
-                    )
-                    data_source = "7-day average"
-                    # Count unique dates to get actual number of days
-                    unique_dates = location_daily_data["date"].nunique()
-                    daily_occupancy = f"{unique_dates} days avg"
-                else:
-                    # Fallback to single day data with column fallback logic
-                    occupancy_pct = self._get_occupancy_with_fallback(row, context)
-                    data_source = "single day"
-                    daily_occupancy = row.get("po_seats_occupied_actual_pct")
-            else:
-                # Fallback to single day data with column fallback logic
-                occupancy_pct = self._get_occupancy_with_fallback(row, context)
-                if occupancy_pct is not None:
-                    occupancy_pct = round(occupancy_pct, 1)
-                data_source = "single day"
-                daily_occupancy = row.get("po_seats_occupied_actual_pct")
-
-            monthly_occupancy = row.get("po_seats_actual_occupied_pct")
-
-            # Fallback to monthly if no daily data available
-            if occupancy_pct is None:
-                occupancy_pct = self._get_occupancy_with_fallback(row, context)
-                if occupancy_pct is not None:
-                    occupancy_pct = round(occupancy_pct, 1)
-                data_source = "monthly"
+                # No daily data: use the first available occupancy column,
+                # preferring the single-day value over the monthly ones
+                occupancy_pct = self._get_occupancy_with_fallback(
+                    row, _occupancy_context(loc)
+                )
                 if occupancy_pct is None:
                     self._logger.warning(f"No occupancy data available for {loc}")
                     continue
-
-            if occupancy_pct is None:
-                print(f"Warning: No occupancy data available for {loc}")
-                continue
+                occupancy_pct = round(occupancy_pct, 1)
 
             # Calculate 3-month average expense for this location
-            location_monthly_data = input_df[
-                (input_df["building_name"] == loc)
-                & (input_df["year"] == target_year)
-                & (
-                    input_df["month"].isin(
-                        [target_month - 2, target_month - 1, target_month]
-                    )
-                )
-            ]
-
-            if location_monthly_data.empty:
-                # Fallback to current month if no 3-month data available
-                avg_exp = abs(parse_float(row.get("exp_total_po_expense_amount")))
-            else:
-                # Calculate 3-month average
+            if loc in unparsed_expense_locations:
+                location_monthly_data = unparsed_expense_rows[loc]
                 expenses = [
                     abs(parse_float(exp))
                     for exp in location_monthly_data["exp_total_po_expense_amount"]
                 ]
                 avg_exp = sum(expenses) / len(expenses)
+            elif loc in average_expenses:
+                avg_exp = average_expenses[loc]
+            else:
+                # Fallback to current month if no 3-month data available
+                avg_exp = abs(parse_float(row.get("exp_total_po_expense_amount")))
 
-            # Fetch published price for this location/month
-            published_price = get_published_price(loc, target_year, target_month)
+            sold_price = row["_sold_price_per_po_seat_actual"]
+            if pd.isna(sold_price):
+                sold_price = (
+                    parse_float(row.get("sold_price_per_po_seat_actual"))
+                    if row.get("sold_price_per_po_seat_actual")
+                    not in [None, "None", ""]
+                    else None
+                )
+
+            # Published price for this location/month
+            published_price = published_prices.get(loc)
 
             location_data = LocationData(
                 name=loc,
-                exp_total_po_expense_amount=parse_float(
-                    row.get("exp_total_po_expense_amount"), absolute=True
-                ),
                 avg_exp_total_po_expense_amount=avg_exp,
                 po_seats_occupied_actual_pct=occupancy_pct,
-                po_seats_occupied_pct=(
-                    parse_pct(row.get("po_seats_occupied_pct"))
-                    if row.get("po_seats_occupied_pct") not in [None, "None", ""]
-                    else None
-                ),
                 total_po_seats=total_po_seats,
                 published_price=published_price,
-                sold_price_per_po_seat_actual=(
-                    parse_float(row.get("sold_price_per_po_seat_actual"))
-                    if row.get("sold_price_per_po_seat_actual")
-                    not in [None, "None", ""]
-                    else None
-                ),
+                sold_price_per_po_seat_actual=sold_price,
             )
 
             # Calculate pricing with proper error handling
-            calc_context = create_error_context(
-                "calculate_pricing", loc, "pricing_calculator"
-            )
-
             with error_boundary(
                 "pricing_calculation", loc, "PricingCalculator", reraise=False
             ):
                 pricing_result = calculator.calculate_pricing(location_data)
 
-                # Prepare context for LLM reasoning
-                llm_context = {
-                    "location": loc,
-                    "recommended_price": pricing_result.final_price,
-                    "occupancy_pct": location_data.po_seats_occupied_actual_pct,
-                    "target_breakeven_occupancy_pct": pricing_result.target_breakeven_occupancy_pct,
-                    "actual_breakeven_occupancy_pct": pricing_result.actual_breakeven_occupancy_pct,
-                    "published_price": location_data.published_price,
-                }
-
-                # Generate LLM reasoning with error handling
-                llm_reasoning = None
-                if verbose:
-                    with error_boundary(
-                        "llm_reasoning", loc, "LLMService", reraise=False
-                    ):
-                        llm_reasoning = generate_llm_reasoning(llm_context)
-
-                output = PricingCLIOutput(
+                # Every field is computed above, so skip Pydantic validation
+                output = PricingCLIOutput.fast_new(
                     building_name=loc,
                     occupancy_pct=round(location_data.po_seats_occupied_actual_pct, 2),
                     target_breakeven_occupancy_pct=round(
@@ -396,9 +511,9 @@ class PricingService(PricingServiceInterface):
                     ),
                     dynamic_multiplier=pricing_result.dynamic_multiplier,
                     recommended_price=pricing_result.final_price,
-                    losing_money=pricing_result.losing_money,
+                    losing_money=pricing_result.is_losing_money,
                     manual_override=None,
-                    llm_reasoning=llm_reasoning,
+                    llm_reasoning=None,
                     published_price=location_data.published_price,
                     breakeven_price=pricing_result.breakeven_price,
                     sold_price_per_po_seat_actual=location_data.sold_price_per_po_seat_actual,
@@ -406,9 +521,49 @@ class PricingService(PricingServiceInterface):
                 )
                 outputs.append(output)
 
+                if verbose:
+                    # Prepare context for LLM reasoning
+                    llm_context = {
+                        "location": loc,
+                        "recommended_price": pricing_result.final_price,
+                        "occupancy_pct": location_data.po_seats_occupied_actual_pct,
+                        "target_breakeven_occupancy_pct": pricing_result.target_breakeven_occupancy_pct,
+                        "actual_breakeven_occupancy_pct": pricing_result.actual_breakeven_occupancy_pct,
+                        "published_price": location_data.published_price,
+                    }
+                    reasoning_jobs.append((output, llm_context))
+
+        if reasoning_jobs:
+            self._add_llm_reasoning(reasoning_jobs)
+
         return outputs
 
-    async def get_pricing_for_location(
+    def _add_llm_reasoning(
+        self, jobs: List[Tuple[PricingCLIOutput, Dict[str, Any]]]
+    ) -> None:
+        """
+        Fill in llm_reasoning for each output, running the LLM calls concurrently.
+
+        Each call is a network round trip, so a small thread pool turns the
+        total wait into roughly the slowest call instead of the sum of all.
+        """
+
+        def _generate(job: Tuple[PricingCLIOutput, Dict[str, Any]]) -> Optional[str]:
+            output, llm_context = job
+            # Generate LLM reasoning with error handling
+            with error_boundary(
+                "llm_reasoning", output.building_name, "LLMService", reraise=False
+            ):
+                return generate_llm_reasoning_cached(llm_context)
+            return None
+
+        with ThreadPoolExecutor(
+            max_workers=min(_LLM_MAX_CONCURRENCY, len(jobs))
+        ) as executor:
+            for (output, _), llm_reasoning in zip(jobs, executor.map(_generate, jobs)):
+                output.llm_reasoning = llm_reasoning
+
+    def get_pricing_for_location(
         self, location: str, year: Optional[int] = None, month: Optional[int] = None
     ) -> Optional[PricingCLIOutput]:
         """
@@ -423,12 +578,12 @@ class PricingService(PricingServiceInterface):
             PricingCLIOutput or None if location not found
         """
         # Set default year/month if not provided
-        now = datetime.now()
-        target_year = year if year is not None else now.year
-        target_month = month if month is not None else now.month
+        today = date.today()
+        target_year = year if year is not None else today.year
+        target_month = month if month is not None else today.month
 
         # Load data and config
-        target_date = f"{target_year}-{target_month:02d}-01"  # Use first day of month
+        target_date = _target_date_str(target_year, target_month)
         df = self._load_data(target_date, location)
         config = self._load_config()
 
@@ -442,11 +597,12 @@ class PricingService(PricingServiceInterface):
             target_year=target_year,
             target_month=target_month,
             verbose=False,
+            target_location=location,
         )
 
         return outputs[0] if outputs else None
 
-    async def get_pricing_for_all_locations(
+    def get_pricing_for_all_locations(
         self, year: Optional[int] = None, month: Optional[int] = None
     ) -> List[PricingCLIOutput]:
         """
@@ -460,12 +616,12 @@ class PricingService(PricingServiceInterface):
             List of PricingCLIOutput objects
         """
         # Set default year/month if not provided
-        now = datetime.now()
-        target_year = year if year is not None else now.year
-        target_month = month if month is not None else now.month
+        today = date.today()
+        target_year = year if year is not None else today.year
+        target_month = month if month is not None else today.month
 
         # Load data and config
-        target_date = f"{target_year}-{target_month:02d}-01"  # Use first day of month
+        target_date = _target_date_str(target_year, target_month)
         df = self._load_data(target_date)
         config = self._load_config()
 
@@ -486,6 +642,7 @@ class PricingService(PricingServiceInterface):
 
 # Global service instance (dependency injection)
 _pricing_service: Optional[PricingService] = None
+_pricing_service_lock = threading.Lock()
 
 
 def get_pricing_service() -> PricingService:
@@ -497,5 +654,7 @@ def get_pricing_service() -> PricingService:
     """
     global _pricing_service
     if _pricing_service is None:
-        _pricing_service = PricingService()
+        with _pricing_service_lock:
+            if _pricing_service is None:
+                _pricing_service = PricingService()
     return _pricing_service
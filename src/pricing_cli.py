@@ -21,77 +21,79 @@ Usage:
 """
 
 import argparse
-import pandas as pd
 import datetime
+from typing import TYPE_CHECKING
 
-try:
-    from src.data.storage import load_from_sqlite
-    from src.config.rules import load_pricing_rules
+# pandas and the pricing modules are imported inside the commands that need
+# them, so argument parsing and --help do not pay their import cost
+if TYPE_CHECKING:
     from src.pricing.models import PricingCLIOutput
-    from src.pricing.service import get_pricing_service
-    from src.utils.parsing import format_price_int
-except ImportError:
-    # Fallback for when running the script directly
-    from data.storage import load_from_sqlite
-    from config.rules import load_pricing_rules
-    from pricing.models import PricingCLIOutput
-    from pricing.service import get_pricing_service
-    from utils.parsing import format_price_int
-
-
-def format_cli_output(output: PricingCLIOutput, verbose: bool = False) -> str:
-    """Format pricing output for CLI display."""
 
-    def round_to_nearest(val, nearest):
-        if val is None:
-            return "Not set"
-        import math
 
-        return f"{int(round(val / nearest) * nearest):,}"
+def _round_to_nearest(val, nearest):
+    if val is None:
+        return "Not set"
+    return f"{int(round(val / nearest) * nearest):,}"
+
+
+def format_cli_output(output: "PricingCLIOutput", verbose: bool = False) -> str:
+    """Format pricing output for CLI display."""
+    try:
+        from src.utils.parsing import format_price_int
+    except ImportError:
+        from utils.parsing import format_price_int
 
-    lines = [f"{output.building_name}:"]
-    lines.append(f"  Latest Occupancy: {output.occupancy_pct:.1f}%")
     if output.actual_breakeven_occupancy_pct is not None:
-        lines.append(
-            f"  Actual Breakeven Occupancy: {output.actual_breakeven_occupancy_pct:.1f}%"
-        )
+        actual_breakeven = f"{output.actual_breakeven_occupancy_pct:.1f}%"
     else:
-        lines.append(f"  Actual Breakeven Occupancy: Not available")
-    if output.sold_price_per_po_seat_actual is not None:
-        lines.append(
-            f"  Sold Price/Seat (Actual): {round_to_nearest(output.sold_price_per_po_seat_actual, 10000)}"
-        )
-    lines.append("")  # Empty line for separation
-    # Add smart target indicator
-    target_indicator = (
-        " (Smart Target)" if output.is_smart_target else " (Static Target)"
+        actual_breakeven = "Not available"
+    sold_price = (
+        f"\n  Sold Price/Seat (Actual): "
+        f"{_round_to_nearest(output.sold_price_per_po_seat_actual, 10000)}"
+        if output.sold_price_per_po_seat_actual is not None
+        else ""
     )
-    lines.append(
-        f"  Target Breakeven Occupancy: {output.target_breakeven_occupancy_pct:.1f}%{target_indicator}"
+    target_indicator = "Smart Target" if output.is_smart_target else "Static Target"
+    multiplier = (
+        f"\n  Dynamic Multiplier: {output.dynamic_multiplier:.2f}x"
+        if verbose and output.dynamic_multiplier is not None
+        else ""
     )
-    if verbose and output.dynamic_multiplier is not None:
-        lines.append(f"  Dynamic Multiplier: {output.dynamic_multiplier:.2f}x")
     if output.published_price is not None:
-        lines.append(
-            f"  Published Price: {format_price_int(output.published_price)} (Valid from Jul 2025)"
-        )
+        published = f"{format_price_int(output.published_price)} (Valid from Jul 2025)"
     else:
-        lines.append(f"  Published Price: Not set")
-    lines.append(f"  Recommended Price: {format_price_int(output.recommended_price)}")
-    if output.breakeven_price is not None:
-        lines.append(
-            f"  Bottom Price: {round_to_nearest(output.breakeven_price, 50000)}"
-        )
-    if output.losing_money:
-        lines.append("  ⚠️ ALERT: This location is losing money at current occupancy!")
-    lines.append("")  # Empty line for separation
-    if (
-        verbose
+        published = "Not set"
+    bottom_price = (
+        f"\n  Bottom Price: {_round_to_nearest(output.breakeven_price, 50000)}"
+        if output.breakeven_price is not None
+        else ""
+    )
+    alert = (
+        "\n  ⚠️ ALERT: This location is losing money at current occupancy!"
+        if output.losing_money
+        else ""
+    )
+    reasoning = (
+        f"\n  Reasoning: {output.llm_reasoning}"
+        if verbose
         and output.llm_reasoning
         and not output.llm_reasoning.startswith("[LLM reasoning unavailable")
-    ):
-        lines.append(f"  Reasoning: {output.llm_reasoning}")
-    return "\n".join(lines)
+        else ""
+    )
+    return (
+        f"{output.building_name}:\n"
+        f"  Latest Occupancy: {output.occupancy_pct:.1f}%\n"
+        f"  Actual Breakeven Occupancy: {actual_breakeven}"
+        f"{sold_price}\n"
+        f"\n"
+        f"  Target Breakeven Occupancy: "
+        f"{output.target_breakeven_occupancy_pct:.1f}% ({target_indicator})"
+        f"{multiplier}\n"
+        f"  Published Price: {published}\n"
+        f"  Recommended Price: {format_price_int(output.recommended_price)}"
+        f"{bottom_price}{alert}\n"
+        f"{reasoning}"
+    )
 
 
 def run_pipeline(
@@ -103,6 +105,12 @@ def run_pipeline(
     target_date=None,
 ):
     """Run the pricing pipeline for specified parameters."""
+    try:
+        from src.pricing.service import get_pricing_service
+    except ImportError:
+        # Fallback for when running the script directly
+        from pricing.service import get_pricing_service
+
     now = datetime.datetime.now()
     target_year = int(year) if year is not None else now.year
     target_month = int(month) if month is not None else now.month
@@ -147,17 +155,28 @@ def run_pipeline(
 
 def check_pricing(year=None, month=None):
     """Check pricing for all locations with verbose output."""
+    import pandas as pd
+
     try:
-        df = load_from_sqlite("pnl_sms_by_month")
-        print(f"Loaded {len(df)} rows from SQLite table 'pnl_sms_by_month'.")
-    except Exception as e:
-        print(f"Error loading data from SQLite: {e}")
-        df = pd.DataFrame()
+        from src.data.storage import load_from_sqlite_filtered
+        from src.pricing.service import get_pricing_service
+    except ImportError:
+        # Fallback for when running the script directly
+        from data.storage import load_from_sqlite_filtered
+        from pricing.service import get_pricing_service
 
     now = datetime.datetime.now()
     target_year = int(year) if year is not None else now.year
     target_month = int(month) if month is not None else now.month
 
+    try:
+        # The pipeline only needs the target month and the 3 months before it
+        df = load_from_sqlite_filtered("pnl_sms_by_month", target_year, target_month)
+        print(f"Loaded {len(df)} rows from SQLite table 'pnl_sms_by_month'.")
+    except Exception as e:
+        print(f"Error loading data from SQLite: {e}")
+        df = pd.DataFrame()
+
     # Get the pricing service instance
     pricing_service = get_pricing_service()
     outputs = pricing_service.run_pricing_pipeline(
@@ -1,5 +1,10 @@
+import math
+from functools import lru_cache
 from typing import Any, Optional
 
+import numpy as np
+import pandas as pd
+
 try:
     from src.utils.error_handler import safe_parse, create_error_context
     from src.exceptions import ParsingException
@@ -9,6 +14,22 @@ except ImportError:
     from exceptions import ParsingException
 
 
+# Deletes thousands separators in one pass
+_COMMA_TRANS = str.maketrans("", "", ",")
+
+
+def _is_number(val: Any) -> bool:
+    """True for int/float values (bool excluded), which need no string cleanup."""
+    return isinstance(val, (int, float)) and not isinstance(val, bool)
+
+
+def _is_plain_decimal(text: str) -> bool:
+    """True for strings like "-1234.5" that float() accepts without raising."""
+    if text[:1] == "-":
+        text = text[1:]
+    return text.replace(".", "", 1).isdecimal()
+
+
 def parse_float(
     val: Any, absolute: bool = False, context: Optional[dict] = None
 ) -> float:
@@ -24,11 +45,20 @@ def parse_float(
     Returns:
         Parsed float value or 0.0 if parsing fails
     """
+    # Fast path for values that are already numbers (e.g. from numeric columns)
+    if _is_number(val):
+        return abs(float(val)) if absolute else float(val)
+    # Fast path for plain numeric strings, checked up front instead of
+    # relying on an exception
+    if isinstance(val, str):
+        text = val.translate(_COMMA_TRANS)
+        if _is_plain_decimal(text):
+            return abs(float(text)) if absolute else float(text)
     if context is None:
         context = create_error_context("parse_float", additional_info={"value": val})
 
     def _parse_float_internal(v: Any) -> float:
-        return float(str(v).replace(",", ""))
+        return float(str(v).translate(_COMMA_TRANS))
 
     parsed = safe_parse(_parse_float_internal, val, "float", context, default=0.0)
     return abs(parsed) if absolute else parsed
@@ -45,12 +75,22 @@ def parse_int(val: Any, context: Optional[dict] = None) -> int:
     Returns:
         Parsed integer value or 0 if parsing fails
     """
+    # Fast path for finite numbers; NaN/inf take the normal path and its error
+    if _is_number(val) and math.isfinite(val):
+        return int(val)
+    if isinstance(val, str):
+        text = val.translate(_COMMA_TRANS)
+        if _is_plain_decimal(text):
+            num = float(text)
+            # Overlong digit strings overflow to inf and take the error path
+            if math.isfinite(num):
+                return int(num)
     if context is None:
         context = create_error_context("parse_int", additional_info={"value": val})
 
     def _parse_int_internal(v: Any) -> int:
         # Convert to float first to handle decimal strings, then to int
-        return int(float(str(v).replace(",", "")))
+        return int(float(str(v).translate(_COMMA_TRANS)))
 
     return safe_parse(_parse_int_internal, val, "integer", context, default=0)
 
@@ -67,6 +107,17 @@ def parse_pct(val: Any, context: Optional[dict] = None) -> float:
     Returns:
         Parsed percentage value or 0.0 if parsing fails
     """
+    if _is_number(val):
+        num = float(val)
+        return num * 100 if num < 1.0 else num
+    if isinstance(val, str):
+        if "%" in val:
+            text = val.replace("%", "").strip()
+            if _is_plain_decimal(text):
+                return float(text)
+        elif _is_plain_decimal(val):
+            num = float(val)
+            return num * 100 if num < 1.0 else num
     if context is None:
         context = create_error_context("parse_pct", additional_info={"value": val})
 
@@ -82,6 +133,74 @@ def parse_pct(val: Any, context: Optional[dict] = None) -> float:
     return safe_parse(_parse_pct_internal, val, "percentage", context, default=0.0)
 
 
+def parse_float_series(values: pd.Series, absolute: bool = False) -> pd.Series:
+    """
+    Vectorized parse_float() for a whole Series.
+
+    Unlike parse_float(), values that cannot be parsed become NaN instead of
+    raising, so callers can decide how to handle them.
+
+    Args:
+        values: Series of numeric strings (commas allowed) or numeric values
+        absolute: Whether to return absolute values
+
+    Returns:
+        Series of parsed float values, aligned with the input
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        num = values.astype(float)
+    else:
+        num = pd.to_numeric(
+            values.astype(str).str.replace(",", "", regex=False).str.strip(),
+            errors="coerce",
+        )
+    return num.abs() if absolute else num
+
+
+def parse_int_series(values: pd.Series) -> pd.Series:
+    """
+    Vectorized parse_int() for a whole Series.
+
+    Values are truncated towards zero like parse_int(). The result stays a
+    float Series so that values that cannot be parsed (including NaN and
+    infinity) become NaN instead of raising.
+
+    Args:
+        values: Series of numeric strings (commas allowed) or numeric values
+
+    Returns:
+        Series of truncated values as floats, aligned with the input
+    """
+    num = parse_float_series(values)
+    return np.trunc(num.where(np.isfinite(num)))
+
+
+def parse_pct_series(values: pd.Series) -> pd.Series:
+    """
+    Vectorized parse_pct() for a whole Series.
+
+    Unlike parse_pct(), values that cannot be parsed become NaN instead of
+    raising, so callers can decide how to handle them.
+
+    Args:
+        values: Series of percentage strings or numeric values
+
+    Returns:
+        Series of parsed percentage values (0-100), aligned with the input
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        num = values.astype(float)
+        return num.where(~(num < 1.0), num * 100)
+
+    text = values.astype(str)
+    has_pct = text.str.contains("%", regex=False)
+    num = pd.to_numeric(
+        text.str.replace("%", "", regex=False).str.strip(), errors="coerce"
+    )
+    # "75%" is taken as-is; bare numbers below 1 are decimals (0.75 -> 75.0)
+    return num.where(has_pct | ~(num < 1.0), num * 100)
+
+
 def pct_to_decimal(pct: float) -> float:
     """
     Convert a percentage value to decimal (0-1 range).
@@ -105,4 +224,10 @@ def format_price_int(val: float) -> str:
     """
     if val is None:
         return "Not set"
-    return f"{int(val):,}"
+    return _format_int(int(val))
+
+
+# Rounded prices repeat across rows, so most calls are cache hits
+@lru_cache(maxsize=1024)
+def _format_int(num: int) -> str:
+    return f"{num:,}"
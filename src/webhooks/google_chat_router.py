@@ -1,13 +1,17 @@
 from fastapi import APIRouter, Request, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
+from functools import lru_cache
 from typing import Optional, Literal, Tuple
 from pydantic import BaseModel
-import re
 from src.pricing.service import get_pricing_service
 from src.pricing.formatter import get_formatter
 
 router = APIRouter(prefix="/webhook")
 
+# Formatters are stateless, so one instance serves every request
+_formatter = get_formatter("google_chat")
+
 
 class GoogleChatEvent(BaseModel):
     type: Literal["MESSAGE", "ADDED_TO_SPACE", "REMOVED_FROM_SPACE", "CARD_CLICKED"]
@@ -17,6 +21,17 @@ class GoogleChatEvent(BaseModel):
     user: Optional[dict]
 
 
+def _parse_month_arg(arg: str) -> Optional[Tuple[int, int]]:
+    """Return (year, month) if arg has the YYYY-MM shape, else None."""
+    # isdecimal() matches the same characters as the regex \d
+    if len(arg) == 7 and arg[4] == "-" and arg[:4].isdecimal() and arg[5:].isdecimal():
+        return int(arg[:4]), int(arg[5:])
+    return None
+
+
+# Pure and string-keyed, so repeated commands are served from the cache;
+# invalid commands raise and are not cached.
+@lru_cache(maxsize=256)
 def parse_po_price_command(message_text: str) -> Tuple[str, Optional[str]]:
     # Check if it's a po-price command (case-insensitive)
     if not message_text.strip().lower().startswith("/po-price"):
@@ -28,25 +43,20 @@ def parse_po_price_command(message_text: str) -> Tuple[str, Optional[str]]:
         raise ValueError("Location is required. Usage: /po-price <location> [month]")
 
     parts = args_text.split()
-    location_parts = (
-        parts[:-1]
-        if len(parts) > 1 and re.match(r"^\d{4}-\d{2}$", parts[-1])
-        else parts
-    )
-    location = " ".join(location_parts)
+    year_month = _parse_month_arg(parts[-1]) if len(parts) > 1 else None
+    location = " ".join(parts[:-1] if year_month else parts)
     month = None
-    if len(parts) > 1 and re.match(r"^\d{4}-\d{2}$", parts[-1]):
+    if year_month:
         month = parts[-1]
-        year, month_num = month.split("-")
-        if not (1 <= int(month_num) <= 12):
+        year_int, month_num = year_month
+        if not (1 <= month_num <= 12):
             raise ValueError("Month must be between 01-12")
-        year_int = int(year)
         if not (2020 <= year_int <= 2030):
             raise ValueError("Year must be between 2020-2030")
     return location, month
 
 
-async def get_pricing_data_for_chat(location: str, month: Optional[str] = None):
+def get_pricing_data_for_chat(location: str, month: Optional[str] = None):
     year_param = None
     month_param = None
     if month:
@@ -55,7 +65,7 @@ async def get_pricing_data_for_chat(location: str, month: Optional[str] = None):
         month_param = int(month_str)
     try:
         pricing_service = get_pricing_service()
-        result = await pricing_service.get_pricing_for_location(
+        result = pricing_service.get_pricing_for_location(
             location, year_param, month_param
         )
         if result is None:
@@ -80,9 +90,11 @@ async def receive_google_chat_event(request: Request) -> JSONResponse:
         message_text = event.message.get("text", "") if event.message else ""
         try:
             location, month = parse_po_price_command(message_text)
-            pricing_data = await get_pricing_data_for_chat(location, month)
-            formatter = get_formatter("google_chat")
-            formatted_response = formatter.format_pricing_response(pricing_data)
+            # Pricing is blocking pandas/SQLite work; keep it off the event loop
+            pricing_data = await run_in_threadpool(
+                get_pricing_data_for_chat, location, month
+            )
+            formatted_response = _formatter.format_pricing_response(pricing_data)
             return JSONResponse({"text": formatted_response})
         except ValueError as e:
             return JSONResponse({"text": f"**Error:** {str(e)}"})
@@ -6,6 +6,8 @@ import pytest
 import logging
 from unittest.mock import patch
 
+import pandas as pd
+
 from src.exceptions import (
     PricingEngineException,
     DataNotFoundException,
@@ -22,7 +24,14 @@ from src.utils.error_handler import (
     log_and_continue,
     create_error_context,
 )
-from src.utils.parsing import parse_float, parse_int, parse_pct
+from src.utils.parsing import (
+    parse_float,
+    parse_float_series,
+    parse_int,
+    parse_int_series,
+    parse_pct,
+    parse_pct_series,
+)
 
 
 class TestErrorContext:
@@ -241,3 +250,60 @@ class TestIntegration:
                 results.append(parsed)
 
         assert results == [123.45, 0.0, 67.89]
+
+    def test_numeric_inputs_parse_like_their_strings(self):
+        """Test that the numeric fast paths agree with parsing the same value as text."""
+        for value in [0, 1, 42, -2.5, 0.75, 1234.5]:
+            assert parse_float(value) == parse_float(str(value))
+            assert parse_float(value, absolute=True) == parse_float(
+                str(value), absolute=True
+            )
+            assert parse_int(value) == parse_int(str(value))
+            assert parse_pct(value) == parse_pct(str(value))
+
+        # Booleans are not treated as numbers
+        with pytest.raises(ParsingException):
+            parse_float(True)
+
+    def test_parse_plain_numeric_strings(self):
+        """Test the string fast path and the inputs it leaves to the error path."""
+        assert parse_float("-1,234.5") == -1234.5
+        assert parse_float("-1,234.5", absolute=True) == 1234.5
+        assert parse_int("1,234.9") == 1234
+        assert parse_pct("75%") == 75.0
+        assert parse_pct("0.75") == 75.0
+
+        for value in ["--5", "-", ".", "9" * 400]:
+            with pytest.raises(ParsingException):
+                parse_int(value)
+
+    def test_parse_pct_series_matches_parse_pct(self):
+        """Test that vectorized percentage parsing matches parse_pct."""
+        values = ["75%", "0.5%", "0.75", " 60 ", 0.5, 80]
+        result = parse_pct_series(pd.Series(values, dtype=object))
+        assert result.tolist() == [parse_pct(v) for v in values]
+
+        # Numeric columns skip string handling
+        assert parse_pct_series(pd.Series([0.3, 50.0])).tolist() == [30.0, 50.0]
+
+        # Invalid values become NaN instead of raising
+        assert parse_pct_series(pd.Series(["invalid"])).isna().all()
+
+    def test_parse_float_series_matches_parse_float(self):
+        """Test that vectorized float parsing matches parse_float."""
+        values = ["1,234.5", " 67.89 ", "-100", 42]
+        result = parse_float_series(pd.Series(values, dtype=object), absolute=True)
+        assert result.tolist() == [parse_float(v, absolute=True) for v in values]
+
+        # Invalid values become NaN instead of raising
+        assert parse_float_series(pd.Series(["invalid", None])).isna().all()
+
+    def test_parse_int_series_matches_parse_int(self):
+        """Test that vectorized integer parsing matches parse_int."""
+        values = ["1,234", "12.9", "-7.5", 42]
+        result = parse_int_series(pd.Series(values, dtype=object))
+        assert result.tolist() == [parse_int(v) for v in values]
+
+        # Invalid and non-finite values become NaN instead of raising
+        values = ["invalid", None, "inf", float("nan")]
+        assert parse_int_series(pd.Series(values, dtype=object)).isna().all()
@@ -2,7 +2,8 @@ import os
 import pytest
 from unittest import mock
 import openai
-from src.pricing.reasoning import generate_llm_reasoning
+from src.pricing import reasoning
+from src.pricing.reasoning import generate_llm_reasoning, generate_llm_reasoning_cached
 
 
 def test_generate_llm_reasoning_no_api_key(monkeypatch):
@@ -38,3 +39,34 @@ def test_generate_llm_reasoning_with_mock(monkeypatch):
         ]
         result = generate_llm_reasoning(context)
         assert result == "This is a test reasoning."
+
+
+def test_generate_llm_reasoning_cached_reuses_answers(monkeypatch):
+    reasoning.clear_cache()
+    calls = []
+
+    def fake(context):
+        calls.append(context)
+        return f"reasoning for {context['location']}"
+
+    monkeypatch.setattr(reasoning, "generate_llm_reasoning", fake)
+    context = {"location": "Test Location", "occupancy_pct": 85.0001}
+    first = generate_llm_reasoning_cached(context)
+    second = generate_llm_reasoning_cached({**context, "occupancy_pct": 85.0})
+    assert first == second == "reasoning for Test Location"
+    # The LLM sees the original values, not the rounded cache key
+    assert calls == [context]
+
+    # Unhashable values skip the cache instead of failing
+    unhashable = {"location": "Test Location", "notes": ["a", "b"]}
+    assert generate_llm_reasoning_cached(unhashable) == "reasoning for Test Location"
+    assert calls[-1] is unhashable
+    reasoning.clear_cache()
+
+
+def test_generate_llm_reasoning_cached_skips_fallback(monkeypatch):
+    reasoning.clear_cache()
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    context = {"location": "Test Location", "occupancy_pct": 85.0}
+    assert "OPENAI_API_KEY not set" in generate_llm_reasoning_cached(context)
+    assert reasoning._cached_llm_reasoning.cache_info().currsize == 0
@@ -226,6 +226,37 @@ class TestSmartTargetCalculation:
         assert result.is_smart_target is False
         assert result.target_breakeven_occupancy_pct == 70.0  # Static target
 
+    def test_smart_target_with_fallback_uses_static_target(self):
+        """Test that the fallback helper returns the static target as a float."""
+        target, is_smart = self.calculator.calculate_smart_target_with_fallback(
+            "Test Location", None, 80.0
+        )
+        assert is_smart is False
+        assert target == 70.0
+
+        # Pre-built rules and static target are used as-is
+        from src.pricing.rules import build_rules
+
+        rules = build_rules("Test Location", self.config)
+        target, is_smart = self.calculator.calculate_smart_target_with_fallback(
+            "Test Location", 60.0, 80.0, rules=rules, static_target=65.0
+        )
+        assert is_smart is True
+        assert target == pytest.approx(60.0 * 0.95)
+
+        target, is_smart = self.calculator.calculate_smart_target_with_fallback(
+            "Test Location", -5.0, 80.0, rules=rules, static_target=65.0
+        )
+        assert is_smart is False
+        assert target == 65.0
+
+        # Non-numeric inputs fall back to the static target instead of raising
+        target, is_smart = self.calculator.calculate_smart_target_with_fallback(
+            "Test Location", "n/a", 80.0, rules=rules, static_target=65.0
+        )
+        assert is_smart is False
+        assert target == 65.0
+
     def test_edge_case_zero_occupancy(self):
         """Test smart target calculation with zero occupancy."""
         location_data = LocationData(
@@ -398,6 +429,24 @@ class TestPricingCalculationIntegration:
         assert result.recommended_price > 0
         assert result.target_breakeven_occupancy_pct > 0
 
+    def test_rules_are_memoized_per_location(self):
+        """Test that rules are parsed once per location and share the tiers."""
+        rules = self.calculator._get_rules("Test Location")
+        assert self.calculator._get_rules("Test Location") is rules
+        assert rules.tier_table is self.calculator._tier_table
+        assert rules.dynamic_pricing_tiers is self.calculator._tiers
+
+    def test_config_is_copied(self):
+        """Test that later edits to the caller's config do not reach the calculator."""
+        config = {
+            "locations": {"Test Location": {"use_smart_target": False}},
+            "dynamic_pricing_tiers": [],
+        }
+        calculator = PricingCalculator(config)
+        config["locations"]["Test Location"]["use_smart_target"] = True
+
+        assert calculator._get_rules("Test Location").use_smart_target is False
+
     def test_smart_target_workflow_integration(self):
         """Test complete smart target workflow integration."""
         from src.pricing.rules import build_rules, get_target_breakeven_occupancy
@@ -649,6 +698,29 @@ class TestPricingCalculationIntegration:
         result_high = calculator.calculate_pricing(location_data_high)
         assert result_high.dynamic_multiplier == 1.1
 
+    def test_tier_table_lookup_matches_linear_scan(self):
+        """Test that the tier table picks the same tier as a linear scan."""
+        from src.pricing.models import DynamicPricingTier, TierTable
+
+        tiers = [
+            DynamicPricingTier(min_occupancy=0.0, max_occupancy=20.0, multiplier=0.8),
+            DynamicPricingTier(min_occupancy=20.0, max_occupancy=60.0, multiplier=1.0),
+            DynamicPricingTier(min_occupancy=70.0, max_occupancy=100.0, multiplier=1.1),
+        ]
+        table = TierTable.from_tiers(tiers)
+        unordered = TierTable.from_tiers(list(reversed(tiers)))
+        assert table.ordered is True
+        assert unordered.ordered is False
+
+        for occupancy in [-5.0, 0.0, 10.0, 20.0, 20.5, 60.0, 65.0, 70.0, 100.0, 120.0]:
+            expected = 1.0
+            for tier in tiers:
+                if tier.min_occupancy < occupancy <= tier.max_occupancy:
+                    expected = tier.multiplier
+                    break
+            assert table.multiplier_for(occupancy) == expected
+            assert unordered.multiplier_for(occupancy) == expected
+
 
 class TestErrorHandling:
     """Test error handling in pricing calculator."""
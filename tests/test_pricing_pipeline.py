@@ -1,7 +1,8 @@
 import pandas as pd
+import pytest
 from src.pricing.service import get_pricing_service
 from src.pricing.calculator import PricingCalculator
-from src.pricing.models import LocationData
+from src.pricing.models import LocationData, PricingCLIOutput
 
 
 def mock_config():
@@ -178,3 +179,228 @@ def test_published_price_in_pipeline(monkeypatch):
     # For now, check that the pipeline called get_published_price and the value is accessible if output exposes it
     # If not, this test will need to be updated when published_price is added to output
     # This test ensures the pipeline fetches and uses the published price
+
+
+def test_load_data_is_cached_until_cleared(monkeypatch):
+    from src.pricing.service import PricingService
+
+    service = PricingService()
+    df = pd.DataFrame([{"building_name": "Test Tower"}])
+    calls = []
+
+    def fake_load(target_date, location, auto_fetch=True):
+        calls.append((target_date, location))
+        return df
+
+    monkeypatch.setattr(service._data_loader, "load_merged_pricing_data", fake_load)
+
+    assert service._load_data("2025-07-01", "Test Tower") is df
+    assert service._load_data("2025-07-01", "Test Tower") is df
+    assert len(calls) == 1
+
+    service.cache_clear()
+    service._load_data("2025-07-01", "Test Tower")
+    assert len(calls) == 2
+
+
+def test_load_data_reloads_after_database_write(monkeypatch):
+    from src.pricing.service import PricingService
+
+    service = PricingService()
+    df = pd.DataFrame([{"building_name": "Test Tower"}])
+    calls = []
+    version = [1]
+
+    def fake_load(target_date, location, auto_fetch=True):
+        calls.append((target_date, location))
+        return df
+
+    monkeypatch.setattr(service._data_loader, "load_merged_pricing_data", fake_load)
+    monkeypatch.setattr("src.pricing.service.get_data_version", lambda: version[0])
+
+    service._load_data("2025-07-01", "Test Tower")
+    service._load_data("2025-07-01", "Test Tower")
+    assert len(calls) == 1
+
+    # e.g. a Zoho upsert committed new rows
+    version[0] = 2
+    service._load_data("2025-07-01", "Test Tower")
+    service._load_data("2025-07-01", "Test Tower")
+    assert len(calls) == 2
+
+
+def test_calculator_is_reused_for_same_config():
+    from src.pricing.service import PricingService
+
+    service = PricingService()
+    config = mock_config()
+    calculator = service._get_calculator(config)
+    assert service._get_calculator(config) is calculator
+    assert service._get_calculator(mock_config()) is calculator
+
+    # Editing the config in place must not reuse rules built from the old one
+    config["margin_of_safety"] = 0.25
+    assert service._get_calculator(config) is not calculator
+
+    service.cache_clear()
+    assert service._calculator is None
+
+
+def test_load_pricing_rules_returns_a_copy(tmp_path):
+    from src.config.rules import clear_cache, load_pricing_rules
+
+    path = tmp_path / "rules.yaml"
+    path.write_text("margin_of_safety: 0.5\n")
+    config = load_pricing_rules(str(path))
+    config["margin_of_safety"] = 0.25
+    assert load_pricing_rules(str(path))["margin_of_safety"] == 0.5
+
+    path.write_text("margin_of_safety: 0.75\n")
+    assert load_pricing_rules(str(path))["margin_of_safety"] == 0.5
+    clear_cache()
+    assert load_pricing_rules(str(path))["margin_of_safety"] == 0.75
+
+
+def pipeline_row(name="Test Tower", **fields):
+    """One July 2025 input row; fields add or override columns."""
+    row = {
+        "year": 2025,
+        "month": 7,
+        "building_name": name,
+        "exp_total_po_expense_amount": 100000000,
+        "total_po_seats": 200,
+    }
+    row.update(fields)
+    return row
+
+
+@pytest.fixture
+def run_pipeline(monkeypatch):
+    """
+    Run the pipeline for July 2025 over a list of rows, with no published
+    prices and static 50% targets for Test Tower and Other Tower.
+    """
+    monkeypatch.setattr(
+        "src.pricing.service.get_published_prices", lambda locs, y, m: {}
+    )
+    config = mock_config()
+    config["locations"]["Test Tower"]["use_smart_target"] = False
+    config["locations"]["Other Tower"] = dict(config["locations"]["Test Tower"])
+
+    def run(rows, verbose=False, **kwargs):
+        return get_pricing_service().run_pricing_pipeline(
+            pd.DataFrame(rows),
+            config,
+            target_year=2025,
+            target_month=7,
+            verbose=verbose,
+            **kwargs,
+        )
+
+    return run
+
+
+def test_pipeline_groups_interleaved_locations(run_pipeline):
+    outputs = run_pipeline(
+        [
+            pipeline_row(
+                name,
+                month=month,
+                exp_total_po_expense_amount=expense,
+                po_seats_actual_occupied_pct=80.0,
+            )
+            for month in (6, 7)
+            for name, expense in (("Test Tower", 100000000), ("Other Tower", 50000000))
+        ]
+    )
+    assert [o.building_name for o in outputs] == ["Test Tower", "Other Tower"]
+    # breakeven = expense / (200 seats * 50%), plus 50% margin
+    assert outputs[0].recommended_price == 1500000
+    assert outputs[1].recommended_price == 750000
+    # Outputs skip validation on construction but must still be valid
+    for output in outputs:
+        assert PricingCLIOutput(**output.model_dump()) == output
+
+
+def test_pipeline_only_prices_target_location(run_pipeline):
+    outputs = run_pipeline(
+        [
+            pipeline_row(name, po_seats_actual_occupied_pct=80.0)
+            for name in ("Other Tower", "Test Tower ")
+        ],
+        target_location="test tower",
+    )
+    assert [o.building_name for o in outputs] == ["Test Tower"]
+
+
+def test_pipeline_skips_holding_and_blank_names(run_pipeline):
+    outputs = run_pipeline(
+        [
+            pipeline_row(name, po_seats_actual_occupied_pct=80.0, total_po_seats=seats)
+            # The skipped rows' seat counts would not even parse
+            for name, seats in (("Holding ", "n/a"), ("  ", "n/a"), ("Test Tower", 200))
+        ]
+    )
+    assert [o.building_name for o in outputs] == ["Test Tower"]
+
+
+def test_pipeline_averages_daily_occupancy_per_location(run_pipeline):
+    outputs = run_pipeline(
+        [
+            pipeline_row(
+                name, date=f"2025-07-0{day + 1}", po_seats_occupied_actual_pct=pct
+            )
+            for day, (test_pct, other_pct) in enumerate([("70%", 0.5), ("0.8", 0.6)])
+            for name, pct in (("Test Tower", test_pct), ("Other Tower", other_pct))
+        ]
+    )
+    assert {o.building_name: o.occupancy_pct for o in outputs} == {
+        "Test Tower": 75.0,
+        "Other Tower": 55.0,
+    }
+
+
+def test_pipeline_falls_back_per_location_for_unvectorized_values(run_pipeline):
+    # float() accepts "7_0" but the vectorized parsers do not, so these
+    # locations take the scalar fallback path
+    rows = [
+        pipeline_row(
+            name,
+            date=f"2025-07-0{day + 1}",
+            exp_total_po_expense_amount=exp,
+            po_seats_occupied_actual_pct=pct,
+        )
+        for day, (test_pct, other_exp) in enumerate(
+            [("7_0", "1_00000000"), ("8_0", 100000000)]
+        )
+        for name, pct, exp in (
+            ("Test Tower", test_pct, 100000000),
+            ("Other Tower", 0.6, other_exp),
+        )
+    ]
+    by_name = {o.building_name: o for o in run_pipeline(rows)}
+    assert by_name["Test Tower"].occupancy_pct == 75.0
+    assert by_name["Other Tower"].occupancy_pct == 60.0
+    clean = run_pipeline(
+        [dict(row, exp_total_po_expense_amount=100000000) for row in rows]
+    )
+    other_clean = next(o for o in clean if o.building_name == "Other Tower")
+    assert by_name["Other Tower"].breakeven_price == other_clean.breakeven_price
+
+
+def test_verbose_pipeline_adds_llm_reasoning_per_location(run_pipeline, monkeypatch):
+    monkeypatch.setattr(
+        "src.pricing.service.generate_llm_reasoning_cached",
+        lambda context: f"reasoning for {context['location']}",
+    )
+    outputs = run_pipeline(
+        [
+            pipeline_row(name, po_seats_actual_occupied_pct=80.0)
+            for name in ("Test Tower", "Other Tower")
+        ],
+        verbose=True,
+    )
+    assert [o.llm_reasoning for o in outputs] == [
+        "reasoning for Test Tower",
+        "reasoning for Other Tower",
+    ]
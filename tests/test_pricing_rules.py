@@ -6,10 +6,14 @@ settings validation and error handling.
 """
 
 import pytest
+from src.pricing.models import TierTable
 from src.pricing.rules import (
     build_rules,
+    calculate_smart_target_multiplier,
     get_target_breakeven_occupancy,
     is_smart_target_enabled,
+    parse_dynamic_pricing_tiers,
+    resolve_target_breakeven_occupancy,
     validate_smart_target_configuration,
 )
 
@@ -144,6 +148,23 @@ class TestConfigurationParsing:
         with pytest.raises(ValueError, match="invalid target_breakeven_occupancy"):
             build_rules("Test Location", config)
 
+    def test_build_rules_uses_given_tiers(self):
+        """Test that pre-parsed tiers are shared instead of parsed again."""
+        config = {
+            "dynamic_pricing_tiers": [
+                {"min_occupancy": 0.0, "max_occupancy": 100.0, "multiplier": 1.0},
+            ],
+            "locations": {"Test Location": {"use_smart_target": True}},
+        }
+        tiers = parse_dynamic_pricing_tiers(config)
+        table = TierTable.from_tiers(tiers)
+
+        rules = build_rules("Test Location", config, tiers, table)
+
+        assert rules.dynamic_pricing_tiers is tiers
+        assert rules.tier_table is table
+        assert build_rules("Test Location", config) == rules
+
 
 class TestSmartTargetConfiguration:
     """Test smart target configuration validation."""
@@ -334,6 +355,38 @@ class TestTargetBreakevenOccupancyExtraction:
         assert target < 85.0  # Should be lower than actual breakeven
         assert target > 0.0  # Should be positive
 
+    def test_calculate_smart_target_multiplier_ladder(self):
+        """Test the smart target multiplier ladder boundaries."""
+        # Profitable locations are keyed on actual breakeven
+        assert calculate_smart_target_multiplier(50.0, 60.0) == 0.97
+        assert calculate_smart_target_multiplier(70.0, 80.0) == 0.95
+        assert calculate_smart_target_multiplier(75.0, 85.0) == 0.93
+
+        # Losing money locations are keyed on the loss gap
+        assert calculate_smart_target_multiplier(85.0, 70.0) == 0.97
+        assert calculate_smart_target_multiplier(85.0, 60.0) == 0.94
+        assert calculate_smart_target_multiplier(85.0, 50.0) == 0.90
+
+    def test_resolve_target_breakeven_occupancy_matches_config_lookup(self):
+        """Test that targets from built rules match the raw config lookup."""
+        config = {
+            "locations": {
+                "Smart": {"target_breakeven_occupancy": 65.0, "use_smart_target": True},
+                "Static": {
+                    "target_breakeven_occupancy": 65.0,
+                    "use_smart_target": False,
+                },
+                "Default": {"use_smart_target": True},
+            }
+        }
+
+        for location in config["locations"]:
+            rules = build_rules(location, config)
+            for actual, current in [(None, None), (80.0, 70.0), (60.0, 90.0)]:
+                assert resolve_target_breakeven_occupancy(
+                    rules, actual, current
+                ) == get_target_breakeven_occupancy(location, config, actual, current)
+
 
 class TestConfigurationEdgeCases:
     """Test configuration edge cases and error handling."""
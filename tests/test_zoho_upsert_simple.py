@@ -19,8 +19,11 @@ from src.data.zoho import (
 from src.data.storage import (
     save_to_sqlite,
     load_from_sqlite,
+    load_from_sqlite_filtered,
     delete_from_sqlite_by_year_month,
     delete_from_sqlite_by_range,
+    get_published_price,
+    get_published_prices,
 )
 
 
@@ -369,3 +372,141 @@ class TestZohoUpsertSimple:
         df_jan = df_after[(df_after["year"] == "2025") & (df_after["month"] == "1")]
         assert len(df_jan) == 1
         assert df_jan.iloc[0]["building_name"] == "Jan 2025 Tower"
+
+    def test_load_from_sqlite_filters_by_location(
+        self, temp_db_path, sample_data_2025_05
+    ):
+        """Test that the location filter is applied in SQL, ignoring case."""
+        with sqlite3.connect(temp_db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE pnl_sms_by_month (
+                    year TEXT,
+                    month TEXT,
+                    building_name TEXT,
+                    exp_total_po_expense_amount TEXT,
+                    po_seats_actual_occupied_pct TEXT,
+                    total_po_seats TEXT,
+                    po_seats_occupied_pct TEXT
+                )
+            """
+            )
+            conn.commit()
+        save_to_sqlite(
+            "pnl_sms_by_month",
+            sample_data_2025_05,
+            db_path=temp_db_path,
+            if_exists="append",
+        )
+
+        df = load_from_sqlite(
+            "pnl_sms_by_month", db_path=temp_db_path, location="test tower"
+        )
+        assert df["building_name"].tolist() == ["Test Tower"]
+
+        # Databases created before the NOCASE index existed get it on first use
+        with sqlite3.connect(temp_db_path) as conn:
+            indexes = [
+                row[1] for row in conn.execute("PRAGMA index_list(pnl_sms_by_month)")
+            ]
+        assert indexes == ["idx_pnl_building_nocase_year_month"]
+
+    def test_save_to_sqlite_replace_keeps_schema(self, temp_db_path):
+        """Test that replace swaps the rows but keeps column types and indexes."""
+        with sqlite3.connect(temp_db_path) as conn:
+            conn.execute(
+                "CREATE TABLE pnl_sms_by_month "
+                "(year INTEGER, month INTEGER, building_name TEXT)"
+            )
+            conn.execute("CREATE INDEX idx_ym ON pnl_sms_by_month (year, month)")
+            conn.commit()
+
+        save_to_sqlite(
+            "pnl_sms_by_month",
+            [{"year": 2025, "month": 4, "building_name": "Old Tower"}],
+            db_path=temp_db_path,
+        )
+        save_to_sqlite(
+            "pnl_sms_by_month",
+            [
+                {"year": 2025, "month": 5, "building_name": "Test Tower"},
+                {"year": 2025, "month": 5},
+            ],
+            db_path=temp_db_path,
+        )
+
+        df = load_from_sqlite("pnl_sms_by_month", db_path=temp_db_path)
+        assert df["building_name"].iloc[0] == "Test Tower"
+        assert pd.isna(df["building_name"].iloc[1])
+        with sqlite3.connect(temp_db_path) as conn:
+            types = [
+                row[2] for row in conn.execute("PRAGMA table_info(pnl_sms_by_month)")
+            ]
+            indexes = [
+                row[1] for row in conn.execute("PRAGMA index_list(pnl_sms_by_month)")
+            ]
+        assert types == ["INTEGER", "INTEGER", "TEXT"]
+        assert indexes == ["idx_ym"]
+
+    def test_load_from_sqlite_filtered_reads_target_window(self, temp_db_path):
+        """Test that only the target month and the months before it are read."""
+        with sqlite3.connect(temp_db_path) as conn:
+            conn.execute(
+                "CREATE TABLE pnl_sms_by_month "
+                "(year INTEGER, month INTEGER, building_name TEXT)"
+            )
+            conn.executemany(
+                "INSERT INTO pnl_sms_by_month VALUES (?, ?, ?)",
+                [
+                    (2024, 9, "Test Tower"),
+                    (2024, 10, "Test Tower"),
+                    (2024, 12, "Other Tower"),
+                    (2025, 1, "Test Tower"),
+                    (2025, 2, "Test Tower"),
+                ],
+            )
+            conn.commit()
+
+        df = load_from_sqlite_filtered(
+            "pnl_sms_by_month", 2025, 1, db_path=temp_db_path
+        )
+        assert list(zip(df["year"], df["month"])) == [(2024, 10), (2024, 12), (2025, 1)]
+
+        df = load_from_sqlite_filtered(
+            "pnl_sms_by_month", 2025, 1, location="test tower", db_path=temp_db_path
+        )
+        assert list(zip(df["year"], df["month"])) == [(2024, 10), (2025, 1)]
+
+    def test_get_published_prices_matches_single_lookup(self, temp_db_path):
+        """Test that the bulk published price lookup matches per-building lookups."""
+        with sqlite3.connect(temp_db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE published_prices (
+                    building_name TEXT,
+                    year_from INTEGER,
+                    month_from INTEGER,
+                    year_to INTEGER,
+                    month_to INTEGER,
+                    price INTEGER
+                )
+            """
+            )
+            conn.executemany(
+                "INSERT INTO published_prices VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    ("Test Tower", 2025, 1, 2025, 12, 1000000),
+                    ("Test Tower", 2025, 6, 2025, 8, 1200000),
+                    ("Test Building", 2024, 1, 2024, 12, 900000),
+                ],
+            )
+            conn.commit()
+
+        names = ["Test Tower", "Test Building", "Missing"]
+        prices = get_published_prices(names, 2025, 7, db_path=temp_db_path)
+
+        assert prices == {"Test Tower": 1200000.0}
+        for name in names:
+            assert prices.get(name) == get_published_price(
+                name, 2025, 7, db_path=temp_db_path
+            )